@@ -0,0 +1,100 @@
+"""
+Async Writer Module (background CSV persistence)
+=================================================
+
+Moves history CSV writes off the REPL thread.
+
+- **write_csv_rows**: writes (or appends) row dicts to a CSV file.
+- **AsyncCsvWriter**: queues ``write_csv_rows`` jobs for a daemon thread,
+  which drains all pending jobs per wake-up so bursts of saves are handled
+  together.  Jobs run in submission order, so appends never overtake the
+  rewrite they extend.
+"""
+
+from __future__ import annotations
+
+import csv
+import queue
+import threading
+from typing import Iterable
+
+
+def write_csv_rows(
+    path: str,
+    rows: Iterable[dict],
+    fieldnames: list[str],
+    append: bool,
+    encoding: str = "utf-8",
+) -> None:
+    """Write *rows* to the CSV file at *path*.
+
+    Args:
+        path: Target file.
+        rows: Row dicts keyed by *fieldnames*.
+        fieldnames: Column order; missing keys are written as ``""``.
+        append: Append without a header instead of rewriting the file.
+        encoding: File encoding.
+    """
+    with open(path, "a" if append else "w", newline="", encoding=encoding) as fh:
+        writer = csv.DictWriter(fh, fieldnames=fieldnames, restval="", extrasaction="ignore")
+        if not append:
+            writer.writeheader()
+        writer.writerows(rows)
+
+
+class AsyncCsvWriter:
+    """Runs ``write_csv_rows`` jobs on a background daemon thread.
+
+    The thread is started on the first ``enqueue``.  Errors raised by a
+    job are kept and re-raised by the next ``flush``.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._error: Exception | None = None
+
+    def enqueue(
+        self,
+        path: str,
+        rows: tuple[dict, ...],
+        fieldnames: list[str],
+        append: bool,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Queue a write of *rows* to *path* (see ``write_csv_rows``)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="calculator-csv-writer", daemon=True
+            )
+            self._thread.start()
+        self._queue.put((path, rows, fieldnames, append, encoding))
+
+    def flush(self) -> None:
+        """Block until all queued writes have finished.
+
+        Raises:
+            Exception: The first error raised by a queued write, if any.
+        """
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        """Worker loop: wait for a job, then drain everything pending."""
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for job in batch:
+                try:
+                    write_csv_rows(*job)
+                except Exception as exc:
+                    if self._error is None:
+                        self._error = exc
+                finally:
+                    self._queue.task_done()
@@ -6,17 +6,31 @@ Calculation Module (Factory Pattern)
   operands, an operation, and a computed result.
 - **CalculationFactory**: Creates ``Calculation`` instances from string
   operation names using the operations registry (Factory Pattern).
+
+Calculations normally use ``Decimal`` operands; ``CalculationFactory.create_float``
+builds ``float``-based calculations for the opt-in ``fast`` arithmetic mode.
 """
 
+import functools
+import math
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Callable, Optional
+from typing import Callable, ClassVar, Optional
 from datetime import datetime
 
-from app.operations import get_operation, get_supported_operations
+from app.exceptions import InvalidOperationError, OperationError
+from app.operations import (
+    FLOAT_SAFE_OPERATIONS,
+    get_operation,
+    get_supported_operations,
+)
 
 
 class Calculation:
-    """Immutable record of a single arithmetic calculation.
+    """Record of a single arithmetic calculation.
+
+    Instances use ``__slots__`` (no per-instance ``__dict__``) and are
+    treated as read-only once constructed; immutability is by convention,
+    which keeps ``__init__`` free of ``object.__setattr__`` calls.
 
     Attributes:
         operand_a: The first operand.
@@ -27,8 +41,18 @@ class Calculation:
         timestamp: When the calculation was performed.
     """
 
+    __slots__ = (
+        "operand_a",
+        "operand_b",
+        "operation",
+        "operation_name",
+        "result",
+        "timestamp",
+        "_symbol",
+    )
+
     # Symbols used in the user-friendly __str__ representation
-    _SYMBOLS: dict[str, str] = {
+    _SYMBOLS: ClassVar[dict[str, str]] = {
         "add": "+",
         "subtract": "-",
         "multiply": "*",
@@ -43,8 +67,8 @@ class Calculation:
 
     def __init__(
         self,
-        operand_a: Decimal,
-        operand_b: Decimal,
+        operand_a: Decimal | float,
+        operand_b: Decimal | float,
         operation: Callable,
         operation_name: str,
         precision: int = 2
@@ -52,8 +76,8 @@ class Calculation:
         """Initialize and immediately compute the calculation.
 
         Args:
-            operand_a: The first operand.
-            operand_b: The second operand.
+            operand_a: The first operand (``Decimal``, or ``float`` in fast mode).
+            operand_b: The second operand (same type as *operand_a*).
             operation: Callable that performs the arithmetic.
             operation_name: Human-readable name (e.g., ``"add"``).
             precision: Number of decimal places to round the result to.
@@ -61,21 +85,39 @@ class Calculation:
         Raises:
             DivisionByZeroError: If the operation involves division by zero.
             InvalidOperationError: If the operation is mathematically invalid.
+            OperationError: If a float operation produces a non-real or
+                non-finite result.
         """
         self.operand_a = operand_a
         self.operand_b = operand_b
         self.operation = operation
         self.operation_name = operation_name
+        # operation_name is fixed, so resolve the display symbol once
+        self._symbol = self._SYMBOLS.get(operation_name, operation_name)
         self.timestamp = datetime.now()
         
         raw_result = operation(operand_a, operand_b)
 
+        if isinstance(raw_result, complex):
+            raise OperationError(
+                f"Operation '{operation_name}' produced a non-real result."
+            )
+
+        if isinstance(raw_result, float):
+            if not math.isfinite(raw_result):
+                raise OperationError(
+                    f"Operation '{operation_name}' produced a non-finite result."
+                )
+            # Fast mode: report the float result as the Decimal path would,
+            # starting from its shortest repr so e.g. 2.675 rounds to 2.68
+            raw_result = Decimal(repr(raw_result))
+
         # Round the result to the specified precision
-        if precision >= 0:
+        if precision < 0:
+            self.result = raw_result
+        else:
             rounding_format = f"0.{'0' * precision}" if precision > 0 else "0"
             self.result = raw_result.quantize(Decimal(rounding_format), rounding=ROUND_HALF_UP)
-        else:
-            self.result = raw_result
 
     def __repr__(self) -> str:
         """Return a detailed string representation."""
@@ -86,8 +128,18 @@ class Calculation:
 
     def __str__(self) -> str:
         """Return a user-friendly string (e.g. ``5 + 3 = 8``)."""
-        symbol = self._SYMBOLS.get(self.operation_name, self.operation_name)
-        return f"{self.operand_a} {symbol} {self.operand_b} = {self.result}"
+        return f"{self.operand_a} {self._symbol} {self.operand_b} = {self.result}"
+
+
+@functools.lru_cache(maxsize=None)
+def _float_operation(operation_name: str) -> Callable:
+    """Return the fast (float) *operation_name*, taking operands of any numeric type."""
+    fast_op = get_operation(operation_name, fast=True)
+
+    def operation(a, b):
+        return fast_op(float(a), float(b))
+
+    return operation
 
 
 class CalculationFactory:
@@ -123,6 +175,44 @@ class CalculationFactory:
         return Calculation(operand_a, operand_b, operation, operation_name, precision)
 
     @staticmethod
-    def get_supported_operations() -> list[str]:
-        """Return a list of supported operation names."""
+    def create_float(
+        operand_a: Decimal | float,
+        operand_b: Decimal | float,
+        operation_name: str,
+        precision: int = 2
+    ) -> "Calculation":
+        """Create a ``float``-based ``Calculation`` (fast arithmetic mode).
+
+        Only operations listed in ``FLOAT_SAFE_OPERATIONS`` are accepted.
+        The result is computed by the ``app.fast_ops`` implementation; the
+        operands are kept as given, so they display as in ``create``.
+
+        Args:
+            operand_a: The first operand.
+            operand_b: The second operand.
+            operation_name: Name of the operation.
+            precision: Rounding precision.
+
+        Returns:
+            A ``Calculation`` computed in ``float``, with the result rounded
+            to a ``Decimal`` exactly like ``create``.
+
+        Raises:
+            InvalidOperationError: If the operation has no float fast path.
+            DivisionByZeroError: If dividing by zero.
+            OperationError: If the result overflows or is not a real number.
+        """
+        if operation_name not in FLOAT_SAFE_OPERATIONS:
+            raise InvalidOperationError(
+                f"Operation '{operation_name}' does not support fast arithmetic."
+            )
+        operation = _float_operation(operation_name)
+        try:
+            return Calculation(operand_a, operand_b, operation, operation_name, precision)
+        except OverflowError:
+            raise OperationError(f"Result of '{operation_name}' is too large.")
+
+    @staticmethod
+    def get_supported_operations() -> tuple[str, ...]:
+        """Return the supported operation names."""
         return get_supported_operations()
@@ -6,6 +6,10 @@ Loads application settings from environment variables (with ``.env`` file
 support via ``python-dotenv``).  Validates values and raises
 ``ConfigurationError`` for invalid settings.
 
+Parsed ``.env`` contents are cached per file path and modification time,
+so repeated instantiation does not re-read an unchanged file.  Values from
+the ``.env`` file take precedence over the process environment.
+
 Settings:
     - ``CALCULATOR_LOG_DIR``: Directory for log files (default ``logs``)
     - ``CALCULATOR_LOG_FILE``: Log file name (default ``calculator.log``)
@@ -13,19 +17,39 @@ Settings:
     - ``CALCULATOR_MAX_HISTORY_SIZE``: Maximum history entries (default ``1000``)
     - ``CALCULATOR_AUTO_SAVE``: ``true``/``false`` toggle (default ``true``)
     - ``CALCULATOR_PRECISION``: Decimal places for calculations (default ``2``)
+    - ``CALCULATOR_ARITHMETIC_MODE``: ``exact`` (``Decimal``) or ``fast``
+      (``float`` for simple operations) (default ``exact``)
     - ``CALCULATOR_MAX_INPUT_VALUE``: Maximum allowed input value (default ``1e10``)
     - ``CALCULATOR_DEFAULT_ENCODING``: Default encoding for file operations (default ``utf-8``)
 """
 
 from __future__ import annotations
 
+import functools
 import os
+from typing import ClassVar
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
 
 from app.exceptions import ConfigurationError
 
 
+@functools.lru_cache(maxsize=8)
+def _load_env(env_path: str, mtime: float) -> dict[str, str]:
+    """Parse the ``.env`` file at *env_path*.
+
+    *mtime* is only part of the cache key, so editing the file invalidates
+    the cached values.
+    """
+    if not env_path:
+        return {}
+    return {
+        key: value
+        for key, value in dotenv_values(env_path).items()
+        if value is not None
+    }
+
+
 class CalculatorConfig:
     """Loads and validates calculator settings from the environment.
 
@@ -37,54 +61,76 @@ class CalculatorConfig:
         max_history_size: Maximum number of history entries.
         auto_save: Whether to auto-save after each calculation.
         precision: Number of decimal places for calculations.
+        arithmetic_mode: ``"exact"`` or ``"fast"``.
         max_input_value: Maximum allowed input value.
         default_encoding: Default encoding for file operations.
     """
 
+    ARITHMETIC_MODES: tuple[str, ...] = ("exact", "fast")
+
+    _BOOL_MAP: ClassVar[dict[str, bool]] = {
+        "true": True, "1": True, "yes": True,
+        "false": False, "0": False, "no": False,
+    }
+
     def __init__(self, env_path: str | None = None) -> None:
         """Load config from environment / ``.env`` file.
 
         Args:
             env_path: Optional explicit path to a ``.env`` file.
         """
-        load_dotenv(dotenv_path=env_path, override=True)
-
-        self.log_dir: str = os.getenv("CALCULATOR_LOG_DIR", "logs")
-        self.log_file: str = os.getenv("CALCULATOR_LOG_FILE", "calculator.log")
-        self.history_dir: str = os.getenv("CALCULATOR_HISTORY_DIR", "data")
-        self.history_file: str = os.getenv("CALCULATOR_HISTORY_FILE", "history.csv")
+        resolved = env_path if env_path is not None else find_dotenv()
+        try:
+            mtime = os.stat(resolved).st_mtime if resolved else 0.0
+        except OSError:
+            mtime = 0.0
+        self._env = _load_env(resolved, mtime)
+
+        self.log_dir: str = self._getenv("CALCULATOR_LOG_DIR", "logs")
+        self.log_file: str = self._getenv("CALCULATOR_LOG_FILE", "calculator.log")
+        self.history_dir: str = self._getenv("CALCULATOR_HISTORY_DIR", "data")
+        self.history_file: str = self._getenv("CALCULATOR_HISTORY_FILE", "history.csv")
         self.max_history_size: int = self._parse_positive_int(
-            os.getenv("CALCULATOR_MAX_HISTORY_SIZE", "1000"), "CALCULATOR_MAX_HISTORY_SIZE"
+            self._getenv("CALCULATOR_MAX_HISTORY_SIZE", "1000"), "CALCULATOR_MAX_HISTORY_SIZE"
         )
         self.auto_save: bool = self._parse_bool(
-            os.getenv("CALCULATOR_AUTO_SAVE", "true"), "CALCULATOR_AUTO_SAVE"
+            self._getenv("CALCULATOR_AUTO_SAVE", "true"), "CALCULATOR_AUTO_SAVE"
         )
         self.precision: int = self._parse_non_negative_int(
-            os.getenv("CALCULATOR_PRECISION", "2"), "CALCULATOR_PRECISION"
+            self._getenv("CALCULATOR_PRECISION", "2"), "CALCULATOR_PRECISION"
+        )
+        self.arithmetic_mode: str = self._parse_choice(
+            self._getenv("CALCULATOR_ARITHMETIC_MODE", "exact"), "CALCULATOR_ARITHMETIC_MODE",
+            self.ARITHMETIC_MODES,
         )
         self.max_input_value: float = self._parse_float(
-            os.getenv("CALCULATOR_MAX_INPUT_VALUE", "1e10"), "CALCULATOR_MAX_INPUT_VALUE"
+            self._getenv("CALCULATOR_MAX_INPUT_VALUE", "1e10"), "CALCULATOR_MAX_INPUT_VALUE"
         )
-        self.default_encoding: str = os.getenv("CALCULATOR_DEFAULT_ENCODING", "utf-8")
+        self.default_encoding: str = self._getenv("CALCULATOR_DEFAULT_ENCODING", "utf-8")
 
     # -- helpers ------------------------------------------------------------
 
-    @staticmethod
-    def _parse_bool(value: str, name: str) -> bool:
+    def _getenv(self, key: str, default: str) -> str:
+        """Return *key* from the ``.env`` file, the environment, or *default*."""
+        try:
+            return self._env[key]
+        except KeyError:
+            return os.environ.get(key, default)
+
+    @classmethod
+    def _parse_bool(cls, value: str, name: str) -> bool:
         """Convert a string to a boolean.
 
         Raises:
             ConfigurationError: If the value is not ``true`` or ``false``.
         """
-        lower = value.strip().lower()
-        if lower in ("true", "1", "yes"):
-            return True
-        if lower in ("false", "0", "no"):
-            return False
-        raise ConfigurationError(  # pragma: no cover
-            f"Invalid boolean value for {name}: '{value}'. "
-            "Use 'true' or 'false'."
-        )
+        try:
+            return cls._BOOL_MAP[value.strip().lower()]
+        except KeyError:
+            raise ConfigurationError(
+                f"Invalid boolean value for {name}: '{value}'. "
+                "Use 'true' or 'false'."
+            )
 
     @staticmethod
     def _parse_positive_int(value: str, name: str) -> int:
@@ -95,13 +141,11 @@ class CalculatorConfig:
         """
         try:
             result = int(value)
+            if result <= 0:
+                raise ValueError
         except ValueError:
-            raise ConfigurationError(  # pragma: no cover
-                f"Invalid integer value for {name}: '{value}'."
-            )
-        if result <= 0:
-            raise ConfigurationError(  # pragma: no cover
-                f"{name} must be a positive integer, got {result}."
+            raise ConfigurationError(
+                f"{name} must be a positive integer, got '{value}'."
             )
         return result
 
@@ -124,6 +168,21 @@ class CalculatorConfig:
             )
         return result
 
+    @staticmethod
+    def _parse_choice(value: str, name: str, choices: tuple[str, ...]) -> str:
+        """Convert a string to one of the allowed *choices*.
+
+        Raises:
+            ConfigurationError: If the value is not one of *choices*.
+        """
+        lower = value.strip().lower()
+        if lower not in choices:
+            raise ConfigurationError(
+                f"Invalid value for {name}: '{value}'. "
+                f"Use one of: {', '.join(choices)}."
+            )
+        return lower
+
     @staticmethod
     def _parse_float(value: str, name: str) -> float:
         """Convert a string to a float.
@@ -146,6 +205,7 @@ class CalculatorConfig:
             f"max_history_size={self.max_history_size}, "
             f"auto_save={self.auto_save}, "
             f"precision={self.precision}, "
+            f"arithmetic_mode='{self.arithmetic_mode}', "
             f"max_input_value={self.max_input_value}, "
             f"default_encoding='{self.default_encoding}')"
         )
@@ -6,14 +6,14 @@ Implements the Memento pattern to enable undo and redo of calculator
 history state.
 
 Classes:
-    - **CalculatorMemento**: a snapshot of the history ``DataFrame``.
+    - **CalculatorMemento**: a snapshot of the history rows.
     - **MementoCaretaker**: manages undo / redo stacks and coordinates
       with a ``CalculationHistory`` instance.
 """
 
 from __future__ import annotations
 
-import pandas as pd
+from collections import deque
 
 from app.history import CalculationHistory
 
@@ -21,35 +21,52 @@ from app.history import CalculationHistory
 class CalculatorMemento:
     """Snapshot of the calculator history state.
 
+    Rows are stored as an immutable tuple.  The row dicts themselves are
+    never mutated by ``CalculationHistory``, so a shallow copy suffices.
+
     Attributes:
-        dataframe: A copy of the history ``DataFrame`` at snapshot time.
+        rows: The history rows at snapshot time.
     """
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
-        self.dataframe = dataframe.copy()
+    __slots__ = ("rows",)
+
+    def __init__(self, rows: tuple[dict, ...]) -> None:
+        self.rows = tuple(rows)
 
     def __repr__(self) -> str:
-        return f"CalculatorMemento({len(self.dataframe)} rows)"
+        return f"CalculatorMemento({len(self.rows)} rows)"
 
 
 class MementoCaretaker:
     """Manages an undo / redo stack of ``CalculatorMemento`` objects.
 
+    Both stacks are bounded: once ``max_depth`` snapshots are held, the
+    oldest one is discarded.
+
     Attributes:
         history: The ``CalculationHistory`` instance being managed.
     """
 
-    def __init__(self, history: CalculationHistory) -> None:
+    __slots__ = ("history", "_undo_stack", "_redo_stack")
+
+    def __init__(self, history: CalculationHistory, max_depth: int | None = None) -> None:
+        """Create empty undo / redo stacks.
+
+        Args:
+            history: The ``CalculationHistory`` to snapshot and restore.
+            max_depth: Maximum number of snapshots per stack (``None`` for
+                unbounded).
+        """
         self.history = history
-        self._undo_stack: list[CalculatorMemento] = []
-        self._redo_stack: list[CalculatorMemento] = []
+        self._undo_stack: deque[CalculatorMemento] = deque(maxlen=max_depth)
+        self._redo_stack: deque[CalculatorMemento] = deque(maxlen=max_depth)
 
     def save(self) -> None:
         """Take a snapshot of the current history state.
 
         Clears the redo stack (new action invalidates future redos).
         """
-        snapshot = CalculatorMemento(self.history.get_dataframe())
+        snapshot = CalculatorMemento(self.history.get_rows())
         self._undo_stack.append(snapshot)
         self._redo_stack.clear()
 
@@ -63,12 +80,12 @@ class MementoCaretaker:
             return False
 
         # Save current state for redo
-        current = CalculatorMemento(self.history.get_dataframe())
+        current = CalculatorMemento(self.history.get_rows())
         self._redo_stack.append(current)
 
         # Restore previous state
         memento = self._undo_stack.pop()
-        self.history.set_dataframe(memento.dataframe)
+        self.history.set_rows(memento.rows)
         return True
 
     def redo(self) -> bool:
@@ -81,14 +98,19 @@ class MementoCaretaker:
             return False
 
         # Save current state for undo
-        current = CalculatorMemento(self.history.get_dataframe())
+        current = CalculatorMemento(self.history.get_rows())
         self._undo_stack.append(current)
 
         # Restore redo state
         memento = self._redo_stack.pop()
-        self.history.set_dataframe(memento.dataframe)
+        self.history.set_rows(memento.rows)
         return True
 
+    def clear(self) -> None:
+        """Discard all undo and redo snapshots."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+
     @property
     def can_undo(self) -> bool:
         """Whether there is at least one state to undo to."""
@@ -18,7 +18,9 @@ Commands:
 
 from __future__ import annotations
 
+import sys
 from decimal import Decimal, InvalidOperation
+from typing import Callable
 
 from app.calculation import CalculationFactory
 from app.calculator_config import CalculatorConfig
@@ -34,6 +36,7 @@ from app.history import (
     LoggingObserver,
 )
 from app.input_validators import validate_input_parts
+from app.operations import FLOAT_SAFE_OPERATIONS
 
 
 class Calculator:
@@ -48,6 +51,38 @@ class Calculator:
         caretaker: The ``MementoCaretaker`` for undo / redo.
     """
 
+    # Operands with more significant digits than a float can hold exactly
+    # always take the Decimal path, even in fast mode
+    _FLOAT_MAX_DIGITS: int = 15
+
+    # Operations and special commands are fixed at import time, so the
+    # help text is built once
+    _HELP_TEXT: str = (
+        "=== Calculator Help ===\n"
+        "\n"
+        "Usage: <operation> <number1> <number2>\n"
+        "\n"
+        "Operations: " + ", ".join(CalculationFactory.get_supported_operations()) + "\n"
+        "\n"
+        "Examples:\n"
+        "  add 5 3        => 5 + 3 = 8.00\n"
+        "  subtract 10 4  => 10 - 4 = 6.00\n"
+        "  multiply 6 7   => 6 * 7 = 42.00\n"
+        "  divide 20 4    => 20 / 4 = 5.00\n"
+        "  power 2 8      => 2 ^ 8 = 256.00\n"
+        "  root 9 2       => 9 √ 2 = 3.00\n"
+        "  modulus 10 3   => 10 % 3 = 1.00\n"
+        "  int_divide 10 3 => 10 // 3 = 3.00\n"
+        "  percent 5 100  => 5 %% 100 = 5.00\n"
+        "  abs_diff 5 10  => 5 |-| 10 = 5.00\n"
+        "\n"
+        "Special commands:\n"
+        + "\n".join(
+            f"  {cmd:<10} - {info['description']}"
+            for cmd, info in SPECIAL_COMMANDS.items() if info['handler']
+        )
+    )
+
     def __init__(self, env_path: str | None = None) -> None:
         """Initialize the calculator subsystems.
 
@@ -77,11 +112,20 @@ class Calculator:
         )
         self.history.add_observer(self.logging_observer)
 
-        self.auto_save_observer = AutoSaveObserver(self.history, enabled=self.config.auto_save)
+        self.auto_save_observer = AutoSaveObserver(
+            self.history, enabled=self.config.auto_save, background=True
+        )
         self.history.add_observer(self.auto_save_observer)
 
         # -- Memento (undo / redo) ------------------------------------------
-        self.caretaker = MementoCaretaker(self.history)
+        self.caretaker = MementoCaretaker(self.history, max_depth=self.config.max_history_size)
+
+        # -- Special command dispatch table ---------------------------------
+        self._command_handlers: dict[str, Callable[[], str]] = {
+            name: getattr(self, info["handler"])
+            for name, info in SPECIAL_COMMANDS.items()
+            if info["handler"]
+        }
 
         # -- Auto-load existing history -------------------------------------
         self.history.load_from_csv()
@@ -97,6 +141,7 @@ class Calculator:
             try:
                 user_input = input("\n>>> ").strip()
             except (EOFError, KeyboardInterrupt):
+                self._flush_auto_save()
                 print("\nGoodbye!")
                 break
 
@@ -104,11 +149,19 @@ class Calculator:
                 continue
 
             if user_input.lower() == "exit":
+                self._flush_auto_save()
                 print("Goodbye!")
                 break
 
             self.process_input(user_input)
 
+    def _flush_auto_save(self) -> None:
+        """Flush pending auto-saves on exit, reporting (not raising) a failure."""
+        try:
+            self.auto_save_observer.flush()
+        except OSError as exc:
+            print(f"Error: {exc}")
+
     # ------------------------------------------------------------------
     # Input processing (public for testability)
     # ------------------------------------------------------------------
@@ -125,17 +178,19 @@ class Calculator:
         Returns:
             A feedback message string.
         """
-        parts = user_input.strip().lower().split()
+        # split() already drops surrounding whitespace; only the command
+        # token is case-insensitive, operands are passed through unchanged
+        parts = user_input.split()
         if not parts:
             return ""
 
-        command = parts[0]
+        # Interned once here, so the handler, validator and get_operation
+        # lookups below can match the literal keys by identity
+        command = parts[0] = sys.intern(parts[0].lower())
 
-        if command in SPECIAL_COMMANDS:
-            command_info = SPECIAL_COMMANDS[command]
-            handler_method_name = command_info["handler"]
-            handler_method = getattr(self, handler_method_name)
-            return handler_method()
+        handler = self._command_handlers.get(command)
+        if handler is not None:
+            return handler()
 
         # --- LBYL: validate format ---
         validation_error = validate_input_parts(parts, self.config.max_input_value)
@@ -162,7 +217,12 @@ class Calculator:
         try:
             # Save state before mutation (for undo)
             self.caretaker.save()
-            calc = CalculationFactory.create(operand_a, operand_b, operation_name, self.config.precision)
+            if self._use_fast_path(operation_name, operand_a, operand_b):
+                calc = CalculationFactory.create_float(
+                    operand_a, operand_b, operation_name, self.config.precision
+                )
+            else:
+                calc = CalculationFactory.create(operand_a, operand_b, operation_name, self.config.precision)
         except CalculationError as exc:
             msg = f"Error: {exc}"
             print(msg)
@@ -173,42 +233,27 @@ class Calculator:
         print(result_msg)
         return result_msg
 
+    def _use_fast_path(self, operation_name: str, operand_a: Decimal, operand_b: Decimal) -> bool:
+        """Whether this calculation can use ``float`` arithmetic.
+
+        Requires ``fast`` arithmetic mode, a float-safe operation, and
+        operands that fit in a float without losing significant digits.
+        """
+        return (
+            self.config.arithmetic_mode == "fast"
+            and operation_name in FLOAT_SAFE_OPERATIONS
+            and len(operand_a.as_tuple().digits) <= self._FLOAT_MAX_DIGITS
+            and len(operand_b.as_tuple().digits) <= self._FLOAT_MAX_DIGITS
+        )
+
     # ------------------------------------------------------------------
     # Special command handlers
     # ------------------------------------------------------------------
 
     def _handle_help(self) -> str:
         """Display help information."""
-        operations = CalculationFactory.get_supported_operations()
-
-        # Build the special commands help dynamically
-        special_commands_help = "\n".join(
-            f"  {cmd:<10} - {info['description']}"
-            for cmd, info in SPECIAL_COMMANDS.items() if info['handler']
-        )
-        help_text = (
-            "=== Calculator Help ===\n"
-            "\n"
-            "Usage: <operation> <number1> <number2>\n"
-            "\n"
-            f"Operations: {', '.join(operations)}\n"
-            "\n"
-            "Examples:\n"
-            "  add 5 3        => 5 + 3 = 8.00\n"
-            "  subtract 10 4  => 10 - 4 = 6.00\n"
-            "  multiply 6 7   => 6 * 7 = 42.00\n"
-            "  divide 20 4    => 20 / 4 = 5.00\n"
-            "  power 2 8      => 2 ^ 8 = 256.00\n"
-            "  root 9 2       => 9 √ 2 = 3.00\n"
-            "  modulus 10 3   => 10 % 3 = 1.00\n"
-            "  int_divide 10 3 => 10 // 3 = 3.00\n"
-            "  percent 5 100  => 5 %% 100 = 5.00\n"
-            "  abs_diff 5 10  => 5 |-| 10 = 5.00\n"
-            "\n"
-            f"Special commands:\n{special_commands_help}"
-        )
-        print(help_text)
-        return help_text
+        print(self._HELP_TEXT)
+        return self._HELP_TEXT
 
     def _handle_history(self) -> str:
         """Display the calculation history."""
@@ -218,14 +263,15 @@ class Calculator:
             print(msg)
             return msg
 
-        lines = ["=== Calculation History ==="]
-        for i, row in enumerate(rows, start=1):
-            lines.append(
-                f"  {i}. [{row['timestamp']}] {row['operand_a']} {row['operation']} "
-                f"{row['operand_b']} = {row['result']}"
-            )
-        lines.append(f"\nTotal: {len(rows)} calculation(s)")
-        history_text = "\n".join(lines)
+        entries = "\n".join([
+            f"  {i}. [{row['timestamp']}] {row['operand_a']} {row['operation']} "
+            f"{row['operand_b']} = {row['result']}"
+            for i, row in enumerate(rows, start=1)
+        ])
+        history_text = (
+            f"=== Calculation History ===\n{entries}\n"
+            f"\nTotal: {len(rows)} calculation(s)"
+        )
         print(history_text)
         return history_text
 
@@ -257,15 +303,24 @@ class Calculator:
 
     def _handle_save(self) -> str:
         """Save history to CSV."""
-        path = self.history.save_to_csv()
-        msg = f"History saved to '{path}'."
+        try:
+            path = self.history.save_to_csv()
+        except OSError as exc:
+            msg = f"Error: {exc}"
+        else:
+            self.auto_save_observer.mark_saved()
+            msg = f"History saved to '{path}'."
         print(msg)
         return msg
 
     def _handle_load(self) -> str:
         """Load history from CSV."""
-        count = self.history.load_from_csv()
-        msg = f"Loaded {count} calculation(s) from '{self.history.csv_path}'."
+        try:
+            count = self.history.load_from_csv()
+        except OSError as exc:
+            msg = f"Error: {exc}"
+        else:
+            msg = f"Loaded {count} calculation(s) from '{self.history.csv_path}'."
         print(msg)
         return msg
 
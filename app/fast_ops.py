@@ -0,0 +1,104 @@
+"""
+Fast Operations Module (float arithmetic)
+==========================================
+
+Scalar ``float`` implementations of the float-safe operations (see
+``operations.FLOAT_SAFE_OPERATIONS``) plus ``root`` and ``percent``,
+collected in **FAST_OPERATIONS** and returned by
+``operations.get_operation(name, fast=True)``.  The REPL's opt-in ``fast``
+arithmetic mode uses them through ``CalculationFactory.create_float``.
+
+When ``numba`` is installed these are JIT-compiled (``cache=True``,
+``fastmath=True``); otherwise the plain Python functions are used.
+"""
+
+from __future__ import annotations
+
+from app.exceptions import DivisionByZeroError
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+
+def _jit(func):
+    """Compile *func* with numba when available, else return it unchanged."""
+    return njit(cache=True, fastmath=True)(func) if njit else func
+
+
+# ---------------------------------------------------------------------------
+# Scalar float operations
+# ---------------------------------------------------------------------------
+
+
+@_jit
+def add(a: float, b: float) -> float:
+    """Return ``a + b``."""
+    return a + b
+
+
+@_jit
+def subtract(a: float, b: float) -> float:
+    """Return ``a - b``."""
+    return a - b
+
+
+@_jit
+def multiply(a: float, b: float) -> float:
+    """Return ``a * b``."""
+    return a * b
+
+
+@_jit
+def divide(a: float, b: float) -> float:
+    """Return ``a / b``.
+
+    Raises:
+        DivisionByZeroError: If *b* is zero.
+    """
+    if b == 0.0:
+        raise DivisionByZeroError("Division by zero is not allowed.")
+    return a / b
+
+
+@_jit
+def power(a: float, b: float) -> float:
+    """Return ``a ** b``."""
+    return a ** b
+
+
+@_jit
+def root(a: float, b: float) -> float:
+    """Return the *b*-th root of *a* (``a ** (1 / b)``).
+
+    Raises:
+        DivisionByZeroError: If *b* is zero.
+    """
+    if b == 0.0:
+        raise DivisionByZeroError("Root degree cannot be zero.")
+    return a ** (1.0 / b)
+
+
+@_jit
+def percent(a: float, b: float) -> float:
+    """Return ``(a / b) * 100``.
+
+    Raises:
+        DivisionByZeroError: If *b* is zero.
+    """
+    if b == 0.0:
+        raise DivisionByZeroError("Percentage calculation with respect to zero is not allowed.")
+    return (a / b) * 100.0
+
+
+FAST_OPERATIONS: dict[str, callable] = {
+    "add": add,
+    "subtract": subtract,
+    "multiply": multiply,
+    "divide": divide,
+    "power": power,
+    "root": root,
+    "percent": percent,
+}
+
@@ -2,28 +2,33 @@
 History Module (Observer Pattern + pandas)
 ===========================================
 
-Manages calculation history using a pandas ``DataFrame`` and notifies
-registered observers whenever a new calculation is added.
+Manages calculation history as a list of row dicts (materialized as a
+pandas ``DataFrame`` on demand), persists it with the standard library
+``csv`` module, and notifies registered observers whenever a new
+calculation is added.
 
 Key classes:
     - **CalculationObserver** (ABC): base for Observer pattern implementations.
     - **LoggingObserver**: logs calculations to a file using the logging module.
-    - **AutoSaveObserver**: automatically saves history to CSV on each add.
-    - **CalculationHistory**: stores history in a ``DataFrame``, supports
-      save / load to CSV, and observer notification.
+    - **AutoSaveObserver**: automatically saves history to CSV in batches.
+    - **CalculationHistory**: stores history rows, exposes them as a
+      ``DataFrame``, supports save / load to CSV, and observer notification.
 """
 
 from __future__ import annotations
 
+import csv
 import logging
 import os
 from abc import ABC, abstractmethod
-from datetime import datetime
-
-import pandas as pd
+from typing import IO, TYPE_CHECKING
 
+from app.async_writer import AsyncCsvWriter, write_csv_rows
 from app.calculation import Calculation
 
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 
 # ---------------------------------------------------------------------------
 # Observer base and concrete observers
@@ -33,6 +38,8 @@ from app.calculation import Calculation
 class CalculationObserver(ABC):
     """Abstract base for observers reacting to new calculations."""
 
+    __slots__ = ()
+
     @abstractmethod
     def on_calculation(self, calculation: Calculation) -> None:
         """Called when a new calculation is added to the history.
@@ -45,9 +52,10 @@ class CalculationObserver(ABC):
 class LoggingObserver(CalculationObserver):
     """Observer that logs each new calculation using Python's logging module."""
 
+    __slots__ = ("logger",)
+
     def __init__(self, log_dir: str = "logs", log_file: str = "calculator.log", encoding: str = "utf-8") -> None:
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
 
         log_path = os.path.join(log_dir, log_file)
 
@@ -62,34 +70,87 @@ class LoggingObserver(CalculationObserver):
             self.logger.addHandler(handler)
 
     def on_calculation(self, calculation: Calculation) -> None:
-        """Log the calculation via the logging module."""
-        msg = f"Operation: {calculation.operation_name}, Operands: ({calculation.operand_a}, {calculation.operand_b}), Result: {calculation.result}"
-        self.logger.info(msg)
+        """Log the calculation via the logging module.
+
+        The message is only formatted if INFO records are actually emitted.
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Operation: %s, Operands: (%s, %s), Result: %s",
+                calculation.operation_name,
+                calculation.operand_a,
+                calculation.operand_b,
+                calculation.result,
+            )
 
 
 class AutoSaveObserver(CalculationObserver):
-    """Observer that auto-saves the history to CSV on every calculation."""
+    """Observer that auto-saves the history to CSV in batches.
+
+    Rather than rewriting the CSV after every calculation, writes are
+    coalesced: the history is saved once every ``batch_size`` calculations,
+    and any remainder is written by ``flush``.  With ``background=True`` the
+    batch saves run on a background thread.
+    """
+
+    __slots__ = ("_history", "enabled", "_batch_size", "_background", "_pending")
 
-    def __init__(self, history: "CalculationHistory", enabled: bool = True) -> None:
+    def __init__(
+        self,
+        history: "CalculationHistory",
+        enabled: bool = True,
+        batch_size: int = 16,
+        background: bool = False,
+    ) -> None:
         self._history = history
         self.enabled = enabled
+        self._batch_size = batch_size
+        self._background = background
+        self._pending = 0
 
     def on_calculation(self, calculation: Calculation) -> None:
-        """Save the full history to the configured CSV file if enabled."""
+        """Save the history once a batch of calculations is pending."""
         if self.enabled:
-            self._history.save_to_csv()
+            self._pending += 1
+            if self._pending >= self._batch_size:
+                self._history.save_to_csv(background=self._background)
+                self._pending = 0
+
+    def flush(self) -> None:
+        """Write any pending calculations and wait for background saves.
+
+        Raises:
+            Exception: The error from a failed save.  A save is then kept
+                pending, so the next ``flush`` rewrites the whole file.
+        """
+        try:
+            if self.enabled and self._pending:
+                self._history.save_to_csv()
+                self._pending = 0
+            else:
+                self._history.wait_for_writes()
+        except Exception:
+            if self.enabled and not self._pending:
+                self._pending = 1
+            raise
+
+    def mark_saved(self) -> None:
+        """Forget pending calculations after the history was saved elsewhere."""
+        self._pending = 0
 
 
 # ---------------------------------------------------------------------------
-# CalculationHistory — pandas-backed
+# CalculationHistory — list of row dicts
 # ---------------------------------------------------------------------------
 
 
 class CalculationHistory:
-    """Stores calculation history as a pandas ``DataFrame``.
+    """Stores calculation history as a list of row dicts.
 
-    Observers are notified whenever a calculation is added so they
-    can react (e.g., logging, auto-saving).
+    Rows are appended in O(1); a pandas ``DataFrame`` is only built when
+    explicitly requested via ``get_dataframe``.  Observers are notified
+    whenever a calculation is added so they can react (e.g., logging,
+    auto-saving).
 
     Attributes:
         history_dir: Directory for history files.
@@ -112,11 +173,14 @@ class CalculationHistory:
         self.encoding = encoding
         self.max_size = max_size
 
-        if not os.path.exists(self.history_dir):
-            os.makedirs(self.history_dir)
+        os.makedirs(self.history_dir, exist_ok=True)
 
         self.csv_path = os.path.join(self.history_dir, self.history_file)
-        self._df = pd.DataFrame(columns=self._COLUMNS)
+        self._rows: list[dict] = []
+        # Rows already written to ``_saved_path``; later saves append only the rest
+        self._last_saved_idx = 0
+        self._saved_path: str | None = None
+        self._writer: AsyncCsvWriter | None = None
         self._observers: list[CalculationObserver] = []
 
     # -- Observer management ------------------------------------------------
@@ -142,91 +206,159 @@ class CalculationHistory:
         Args:
             calculation: The calculation to record.
         """
-        new_row = pd.DataFrame(
-            [
-                {
-                    "timestamp": calculation.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                    "operand_a": str(calculation.operand_a),
-                    "operand_b": str(calculation.operand_b),
-                    "operation": calculation.operation_name,
-                    "result": str(calculation.result),
-                }
-            ]
+        self._rows.append(
+            {
+                "timestamp": calculation.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                "operand_a": str(calculation.operand_a),
+                "operand_b": str(calculation.operand_b),
+                "operation": calculation.operation_name,
+                "result": str(calculation.result),
+            }
         )
-        self._df = pd.concat([self._df, new_row], ignore_index=True)
 
         # Enforce max history size
-        if len(self._df) > self.max_size:
-            self._df = self._df.tail(self.max_size).reset_index(drop=True)
+        if len(self._rows) > self.max_size:
+            del self._rows[:-self.max_size]
+            self._last_saved_idx = 0
 
         self._notify_observers(calculation)
 
     def get_all(self) -> list[dict]:
         """Return all history rows as a list of dicts."""
-        return self._df.to_dict(orient="records")
+        return list(self._rows)
+
+    def get_rows(self) -> tuple[dict, ...]:
+        """Return an immutable snapshot of the history rows (used by undo/redo)."""
+        return tuple(self._rows)
+
+    def set_rows(self, rows: tuple[dict, ...]) -> None:
+        """Replace the history rows (used by undo/redo)."""
+        self._rows = list(rows)
+        self._last_saved_idx = 0
 
     def get_dataframe(self) -> pd.DataFrame:
-        """Return a copy of the history ``DataFrame``."""
-        return self._df.copy()
+        """Return the history as a new ``DataFrame``."""
+        # pandas is imported lazily to keep REPL start-up fast
+        import pandas as pd
+
+        return pd.DataFrame(self._rows, columns=self._COLUMNS)
 
     def set_dataframe(self, df: pd.DataFrame) -> None:
-        """Replace the history ``DataFrame`` (used by undo/redo)."""
-        self._df = df.copy()
+        """Replace the history from a ``DataFrame``."""
+        self._rows = df.to_dict("records")
+        self._last_saved_idx = 0
 
     def clear(self) -> None:
         """Remove all rows from the history."""
-        self._df = pd.DataFrame(columns=self._COLUMNS)
+        self._rows.clear()
+        self._last_saved_idx = 0
 
     def __len__(self) -> int:
         """Return the number of rows in the history."""
-        return len(self._df)
+        return len(self._rows)
 
     def __repr__(self) -> str:
-        return f"CalculationHistory({len(self._df)} calculations)"
+        return f"CalculationHistory({len(self._rows)} calculations)"
 
     # -- Persistence --------------------------------------------------------
 
-    def save_to_csv(self, path: str | None = None) -> str:
-        """Save the history ``DataFrame`` to a CSV file.
+    def save_to_csv(self, path: str | None = None, background: bool = False) -> str:
+        """Save the history to a CSV file.
+
+        If the previous save went to the same file, only the rows added
+        since then are appended; otherwise the file is rewritten.
 
         Args:
             path: Optional override for the file path.
+            background: Hand the write to a background thread and return
+                immediately (see ``wait_for_writes``).
 
         Returns:
             The path the file was written to.
+
+        Raises:
+            Exception: A failed background save, re-raised by
+                ``wait_for_writes`` before a synchronous save.
         """
         target = path or self.csv_path
         target_dir = os.path.dirname(target)
-        if target_dir and not os.path.exists(target_dir):
-            os.makedirs(target_dir)
-        self._df.to_csv(target, index=False, encoding=self.encoding)
+        if target_dir:
+            os.makedirs(target_dir, exist_ok=True)
+
+        if not background:
+            # Keep ordering with any writes still queued in the background
+            self.wait_for_writes()
+
+        append = bool(
+            self._last_saved_idx
+            and target == self._saved_path
+            and os.path.exists(target)
+        )
+        rows = tuple(self._rows[self._last_saved_idx:] if append else self._rows)
+
+        if background:
+            if self._writer is None:
+                self._writer = AsyncCsvWriter()
+            self._writer.enqueue(target, rows, self._COLUMNS, append, self.encoding)
+        else:
+            write_csv_rows(target, rows, self._COLUMNS, append, self.encoding)
+
+        self._last_saved_idx = len(self._rows)
+        self._saved_path = target
         return target
 
-    def load_from_csv(self, path: str | None = None) -> int:
+    def _read_rows(self, fh: IO[str]) -> list[dict]:
+        """Read CSV rows from *fh*, keeping only (and all of) ``_COLUMNS``."""
+        reader = csv.DictReader(fh, restval="")
+        return [{col: record.get(col, "") for col in self._COLUMNS} for record in reader]
+
+    def wait_for_writes(self) -> None:
+        """Block until background saves have been written to disk.
+
+        Raises:
+            Exception: The first error raised by a background save.  The
+                rows it was writing may be missing from the file, so the
+                next save rewrites the whole file.
+        """
+        if self._writer is not None:
+            try:
+                self._writer.flush()
+            except Exception:
+                self._last_saved_idx = 0
+                self._saved_path = None
+                raise
+
+    def load_from_csv(self, path: str | IO[str] | None = None) -> int:
         """Load history from a CSV file, replacing current contents.
 
         Args:
-            path: Optional override for the file path.
+            path: Optional override for the file path, or an open text
+                file-like object to read the CSV from.
 
         Returns:
             The number of rows loaded.
+
+        Raises:
+            Exception: A failed background save, re-raised by
+                ``wait_for_writes``.
         """
-        target = path or self.csv_path
-        if os.path.exists(target):
-            try:
-                self._df = pd.read_csv(target, encoding=self.encoding).fillna("")
-                # Ensure expected columns exist
-                for col in self._COLUMNS:
-                    if col not in self._df.columns:
-                        self._df[col] = ""
-
-                # Enforce max history size
-                if len(self._df) > self.max_size:
-                    self._df = self._df.tail(self.max_size).reset_index(drop=True)
-
-                return len(self._df)
-            except Exception as e:
-                # Handle malformed CSV
-                print(f"Error loading CSV: {e}")
-                return 0
-        return 0
+        # Don't read a file that a background save is still writing
+        self.wait_for_writes()
+        try:
+            if hasattr(path, "read"):
+                rows = self._read_rows(path)
+            else:
+                with open(path or self.csv_path, newline="", encoding=self.encoding) as fh:
+                    rows = self._read_rows(fh)
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            # Handle malformed CSV
+            print(f"Error loading CSV: {e}")
+            return 0
+
+        # Enforce max history size
+        self._rows = rows[-self.max_size:]
+        self._last_saved_idx = 0
+
+        return len(self._rows)
@@ -7,9 +7,40 @@ Provides Look-Before-You-Leap validation helpers that check user input
 EAFP style used in the operations module.
 """
 
+import functools
 from decimal import Decimal, InvalidOperation
 
-from app.operations import get_supported_operations
+from app.operations import get_supported_operations, is_supported
+
+# Module-level aliases used on the validate_numeric hot path
+_DECIMAL = Decimal
+_INVALID_OP = InvalidOperation
+
+# Characters a plain decimal literal can contain; anything else is rejected
+# before paying for Decimal's parse-and-raise failure path.
+_NUMERIC_CHARS = frozenset("0123456789.+-eE")
+
+# Static error messages, built once at import
+_ERR_EMPTY = (
+    "Error: Invalid format. Please enter a command.\n"
+    "Type 'help' for available commands."
+)
+_ERR_FORMAT = (
+    "Error: Invalid format. Please use: <operation> <number1> <number2>\n"
+    "Example: add 5 3\n"
+    "Type 'help' for available commands."
+)
+_ERR_UNKNOWN_TEMPLATE = (
+    "Error: Unknown operation '{}'.\n"
+    "Available operations: " + ", ".join(get_supported_operations()) + "\n"
+    "Type 'help' for more information."
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _unknown_op_error(operation: str) -> str:
+    """Return the (memoized) error message for an unknown *operation*."""
+    return _ERR_UNKNOWN_TEMPLATE.format(operation)
 
 
 def validate_input_parts(parts: list[str], max_value: float = 1e10) -> str | None:
@@ -28,49 +59,53 @@ def validate_input_parts(parts: list[str], max_value: float = 1e10) -> str | Non
         An error message string if invalid, or ``None`` if valid.
     """
     if not parts:
-        return (
-            "Error: Invalid format. Please enter a command.\n"
-            "Type 'help' for available commands."
-        )
+        return _ERR_EMPTY
 
     operation = parts[0]
-    valid_operations = get_supported_operations()
 
-    if operation not in valid_operations:
-        return (
-            f"Error: Unknown operation '{operation}'.\n"
-            f"Available operations: {', '.join(valid_operations)}\n"
-            "Type 'help' for more information."
-        )
+    if not is_supported(operation):
+        return _unknown_op_error(operation)
 
     if len(parts) != 3:
-        return (
-            "Error: Invalid format. Please use: <operation> <number1> <number2>\n"
-            "Example: add 5 3\n"
-            "Type 'help' for available commands."
-        )
+        return _ERR_FORMAT
 
     # Range validation
-    for i in [1, 2]:
-        val = validate_numeric(parts[i])
+    limit = _DECIMAL(str(max_value))
+    for token in (parts[1], parts[2]):
+        val = validate_numeric(token)
         if val is None:
-            return f"Error: '{parts[i]}' is not a valid number."
-        if abs(val) > Decimal(str(max_value)):
-            return f"Error: Operand '{parts[i]}' exceeds the maximum allowed value of {max_value}."
+            return f"Error: '{token}' is not a valid number."
+        if abs(val) > limit:
+            return f"Error: Operand '{token}' exceeds the maximum allowed value of {max_value}."
 
     return None
 
 
-def validate_numeric(value: str) -> Decimal | None:
+def validate_numeric(value: str | int | Decimal) -> Decimal | None:
     """Try to convert *value* to a ``Decimal`` (LBYL-style).
 
+    A value that is already a ``Decimal`` is returned unchanged, and an
+    ``int`` (but not a ``bool``) is converted directly.  Strings must be
+    plain ASCII decimal literals: anything with characters outside
+    ``_NUMERIC_CHARS`` is rejected without calling ``Decimal``.  That is
+    narrower than ``Decimal`` itself, which also accepts ``inf`` /
+    ``nan``, non-ASCII digits and ``_`` separators; none of those are
+    valid calculator operands.  Any other type is rejected too.
+
     Args:
-        value: A string that may represent a number.
+        value: A string that may represent a number, an ``int``, or a
+            ``Decimal``.
 
     Returns:
         A ``Decimal`` if the conversion succeeds, or ``None`` on failure.
     """
+    if type(value) is _DECIMAL:
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return _DECIMAL(value)
+    if not isinstance(value, str) or not value or not _NUMERIC_CHARS.issuperset(value):
+        return None
     try:
-        return Decimal(value)
-    except InvalidOperation:
+        return _DECIMAL(value)
+    except _INVALID_OP:
         return None
@@ -9,17 +9,26 @@ Supported operations:
     add, subtract, multiply, divide, power, root, modulus, int_divide,
     percent, abs_diff
 
-The ``get_operation`` helper retrieves a callable by name.
+The ``get_operation`` helper retrieves a callable by name (EAFP lookup,
+memoized since the registry never changes).
 
-Error handling follows EAFP — for example, ``divide`` does not pre-check
-for a zero divisor; callers handle the ``ZeroDivisionError``.
+Operations that divide check for a zero divisor up front and raise
+``DivisionByZeroError``; the success path carries no exception handling.
 """
 
+import functools
 from decimal import Decimal
+from types import MappingProxyType
 
 from app.exceptions import DivisionByZeroError, InvalidOperationError
 
 
+# Shared Decimal constants, built once instead of on every call
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+_HUNDRED = Decimal(100)
+
+
 # ---------------------------------------------------------------------------
 # Arithmetic functions
 # ---------------------------------------------------------------------------
@@ -58,8 +67,6 @@ def multiply(a: Decimal, b: Decimal) -> Decimal:
 def divide(a: Decimal, b: Decimal) -> Decimal:
     """Return the quotient *a* ÷ *b*.
 
-    Uses EAFP: does **not** pre-check for a zero divisor.
-
     Raises:
         DivisionByZeroError: If *b* is zero.
 
@@ -67,10 +74,9 @@ def divide(a: Decimal, b: Decimal) -> Decimal:
         >>> divide(Decimal('10'), Decimal('2'))
         Decimal('5')
     """
-    try:
-        return a / b
-    except Exception:
+    if b == _ZERO:
         raise DivisionByZeroError("Division by zero is not allowed.")
+    return a / b
 
 
 def nth_power(a: Decimal, b: Decimal) -> Decimal:
@@ -95,9 +101,9 @@ def nth_root(a: Decimal, b: Decimal) -> Decimal:
         >>> nth_root(Decimal('9'), Decimal('2'))
         Decimal('3')
     """
-    if b == 0:
+    if b == _ZERO:
         raise DivisionByZeroError("Root degree cannot be zero.")
-    return a ** (Decimal("1") / b)
+    return a ** (_ONE / b)
 
 
 def modulus(a: Decimal, b: Decimal) -> Decimal:
@@ -106,7 +112,7 @@ def modulus(a: Decimal, b: Decimal) -> Decimal:
     Raises:
         DivisionByZeroError: If *b* is zero.
     """
-    if b == 0:
+    if b == _ZERO:
         raise DivisionByZeroError("Modulus by zero is not allowed.")
     return a % b
 
@@ -117,7 +123,7 @@ def int_divide(a: Decimal, b: Decimal) -> Decimal:
     Raises:
         DivisionByZeroError: If *b* is zero.
     """
-    if b == 0:
+    if b == _ZERO:
         raise DivisionByZeroError("Integer division by zero is not allowed.")
     return a // b
 
@@ -130,9 +136,9 @@ def percent(a: Decimal, b: Decimal) -> Decimal:
     Raises:
         DivisionByZeroError: If *b* is zero.
     """
-    if b == 0:
+    if b == _ZERO:
         raise DivisionByZeroError("Percentage calculation with respect to zero is not allowed.")
-    return (a / b) * Decimal("100")
+    return (a / b) * _HUNDRED
 
 
 def abs_diff(a: Decimal, b: Decimal) -> Decimal:
@@ -145,7 +151,7 @@ def abs_diff(a: Decimal, b: Decimal) -> Decimal:
 # ---------------------------------------------------------------------------
 
 
-OPERATIONS: dict[str, callable] = {
+_OPERATIONS: dict[str, callable] = {
     "add": add,
     "subtract": subtract,
     "multiply": multiply,
@@ -158,28 +164,66 @@ OPERATIONS: dict[str, callable] = {
     "abs_diff": abs_diff,
 }
 
+# Public, read-only view of the registry.  The derived views below assume it
+# never changes; lookups inside this module use the plain dict directly.
+OPERATIONS: MappingProxyType[str, callable] = MappingProxyType(_OPERATIONS)
+
+
+# The registry is fixed at import time, so derived views are computed once.
+_SUPPORTED_OPS_TUPLE: tuple[str, ...] = tuple(OPERATIONS)
+_SUPPORTED_OPS_SET: frozenset[str] = frozenset(OPERATIONS)
+_SUPPORTED_OPS_JOINED: str = ", ".join(OPERATIONS)
 
-def get_operation(name: str) -> callable:
+# Operations whose float results are close enough to the Decimal ones to be
+# used by the opt-in ``fast`` arithmetic mode.
+FLOAT_SAFE_OPERATIONS: frozenset[str] = frozenset(
+    {"add", "subtract", "multiply", "divide", "power"}
+)
+
+
+@functools.lru_cache(maxsize=32)
+def get_operation(name: str, fast: bool = False) -> callable:
     """Look up an operation callable by *name*.
 
+    Results are cached (room for every name in both modes); unknown names
+    raise and are not cached.
+
     Args:
         name: The operation name (case-sensitive, lower-case expected).
+        fast: Return the ``float`` implementation from ``app.fast_ops``
+            (JIT-compiled when numba is installed) instead of the
+            ``Decimal`` one.
 
     Returns:
         The corresponding arithmetic function.
 
     Raises:
-        InvalidOperationError: If *name* is not in the registry.
+        InvalidOperationError: If *name* is not in the registry, or has no
+            fast implementation when *fast* is set.
     """
-    operation = OPERATIONS.get(name)
-    if operation is None:
-        supported = ", ".join(OPERATIONS.keys())
+    if fast:
+        # Imported lazily: fast_ops pulls in numba, if installed
+        from app.fast_ops import FAST_OPERATIONS
+
+        try:
+            return FAST_OPERATIONS[name]
+        except KeyError:
+            raise InvalidOperationError(
+                f"Operation '{name}' has no fast implementation."
+            )
+    try:
+        return _OPERATIONS[name]
+    except KeyError:
         raise InvalidOperationError(
-            f"Unknown operation '{name}'. Supported: {supported}"
+            f"Unknown operation '{name}'. Supported: {_SUPPORTED_OPS_JOINED}"
         )
-    return operation
 
 
-def get_supported_operations() -> list[str]:
-    """Return a sorted list of supported operation names."""
-    return list(OPERATIONS.keys())
+def get_supported_operations() -> tuple[str, ...]:
+    """Return the supported operation names, in registry order."""
+    return _SUPPORTED_OPS_TUPLE
+
+
+def is_supported(name: str) -> bool:
+    """Return whether *name* is a registered operation."""
+    return name in _SUPPORTED_OPS_SET
@@ -1,10 +1,12 @@
 """Entry point for the Calculator application."""
 
-from app.calculator_repl import Calculator
-
 
 def main() -> None:
     """Create a Calculator instance and start the REPL."""
+    # Imported here so importing this module stays cheap; the REPL and its
+    # dependencies (dotenv, logging, ...) load only when main() runs.
+    from app.calculator_repl import Calculator
+
     calculator = Calculator()
     calculator.run()
 
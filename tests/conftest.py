@@ -6,14 +6,30 @@ from decimal import Decimal
 from app.calculation import Calculation
 from app.operations import add, subtract, multiply, divide
 
+# Operand constants shared by the session-scoped fixtures below
+_D5 = Decimal("5")
+_D3 = Decimal("3")
+_D10 = Decimal("10")
+_D4 = Decimal("4")
 
-@pytest.fixture
+
+def pytest_configure(config) -> None:
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers", "slow: real disk I/O or subprocesses; skip with -m 'not slow'"
+    )
+    config.addinivalue_line(
+        "markers", "smoke: entry-point checks, deselected by default; run with -m smoke"
+    )
+
+
+@pytest.fixture(scope="session")
 def sample_add_calc() -> Calculation:
-    """Provide a sample addition Calculation."""
-    return Calculation(Decimal("5"), Decimal("3"), add, "add")
+    """Provide a sample addition Calculation (shared; do not mutate)."""
+    return Calculation(_D5, _D3, add, "add")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_subtract_calc() -> Calculation:
-    """Provide a sample subtraction Calculation."""
-    return Calculation(Decimal("10"), Decimal("4"), subtract, "subtract")
+    """Provide a sample subtraction Calculation (shared; do not mutate)."""
+    return Calculation(_D10, _D4, subtract, "subtract")
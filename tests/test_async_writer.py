@@ -0,0 +1,69 @@
+"""
+Tests for the Async Writer Module
+==================================
+
+Tests for write_csv_rows and the AsyncCsvWriter background queue.
+"""
+
+import csv
+
+import pytest
+
+from app import async_writer
+from app.async_writer import AsyncCsvWriter, write_csv_rows
+
+
+_FIELDS = ["a", "b"]
+
+
+def _read(path) -> list[dict]:
+    with open(path, newline="") as fh:
+        return list(csv.DictReader(fh))
+
+
+class TestWriteCsvRows:
+    """Tests for write_csv_rows."""
+
+    def test_write_and_append(self, tmp_path) -> None:
+        """Rewrites include a header; appends only add rows."""
+        path = str(tmp_path / "out.csv")
+        write_csv_rows(path, [{"a": "1", "b": "2"}], _FIELDS, append=False)
+        write_csv_rows(path, [{"a": "3"}], _FIELDS, append=True)
+        assert _read(path) == [{"a": "1", "b": "2"}, {"a": "3", "b": ""}]
+
+
+class TestAsyncCsvWriter:
+    """Tests for AsyncCsvWriter."""
+
+    def test_jobs_run_in_order(self, tmp_path) -> None:
+        """Queued writes are applied in submission order."""
+        path = str(tmp_path / "out.csv")
+        writer = AsyncCsvWriter()
+        writer.enqueue(path, ({"a": "1", "b": "1"},), _FIELDS, append=False)
+        for i in range(2, 6):
+            writer.enqueue(path, ({"a": str(i), "b": str(i)},), _FIELDS, append=True)
+        writer.flush()
+        assert [row["a"] for row in _read(path)] == ["1", "2", "3", "4", "5"]
+
+    def test_flush_without_jobs(self) -> None:
+        """Flushing an idle writer returns immediately."""
+        AsyncCsvWriter().flush()
+
+    def test_failed_job_raised_by_flush(self, tmp_path, monkeypatch) -> None:
+        """A failing job is re-raised once by flush; later jobs still run."""
+        path = str(tmp_path / "out.csv")
+        real_write = async_writer.write_csv_rows
+
+        def write(target, rows, *args) -> None:
+            if rows[0]["a"] == "bad":
+                raise OSError("disk full")
+            real_write(target, rows, *args)
+
+        monkeypatch.setattr(async_writer, "write_csv_rows", write)
+        writer = AsyncCsvWriter()
+        writer.enqueue(path, ({"a": "bad"},), _FIELDS, append=False)
+        writer.enqueue(path, ({"a": "1", "b": "1"},), _FIELDS, append=False)
+        with pytest.raises(OSError, match="disk full"):
+            writer.flush()
+        writer.flush()
+        assert _read(path) == [{"a": "1", "b": "1"}]
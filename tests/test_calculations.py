@@ -2,16 +2,49 @@
 Tests for the Calculation Module
 =================================
 
-Parameterized tests for ``Calculation`` and ``CalculationFactory``,
+Table-driven tests for ``Calculation`` and ``CalculationFactory``,
 covering creation, string representations, and error paths.
 """
 
 import pytest
 from decimal import Decimal
 
-from app.operations import add, subtract, multiply, divide, nth_power, nth_root, modulus, int_divide, percent, abs_diff
+from app.operations import (
+    FLOAT_SAFE_OPERATIONS,
+    add, subtract, multiply, divide, nth_power, nth_root, modulus, int_divide, percent, abs_diff,
+)
 from app.calculation import Calculation, CalculationFactory
-from app.exceptions import DivisionByZeroError, InvalidOperationError
+from app.exceptions import DivisionByZeroError, InvalidOperationError, OperationError
+
+
+# (a, b, operation, op_name, expected) — checked in one pass per test
+# rather than one parametrized test node per row.
+_CASES = (
+    (Decimal("5"), Decimal("3"), add, "add", Decimal("8.00")),
+    (Decimal("10"), Decimal("4"), subtract, "subtract", Decimal("6.00")),
+    (Decimal("6"), Decimal("7"), multiply, "multiply", Decimal("42.00")),
+    (Decimal("20"), Decimal("4"), divide, "divide", Decimal("5.00")),
+    (Decimal("2"), Decimal("8"), nth_power, "power", Decimal("256.00")),
+    (Decimal("9"), Decimal("2"), nth_root, "root", Decimal("3.00")),
+    (Decimal("10"), Decimal("3"), modulus, "modulus", Decimal("1.00")),
+    (Decimal("10"), Decimal("3"), int_divide, "int_divide", Decimal("3.00")),
+    (Decimal("5"), Decimal("100"), percent, "percent", Decimal("5.00")),
+    (Decimal("5"), Decimal("10"), abs_diff, "abs_diff", Decimal("5.00")),
+)
+
+# (op_name, a, b, expected) for CalculationFactory.create
+_FACTORY_CASES = (
+    ("add", Decimal("2"), Decimal("3"), Decimal("5.00")),
+    ("subtract", Decimal("10"), Decimal("3"), Decimal("7.00")),
+    ("multiply", Decimal("4"), Decimal("5"), Decimal("20.00")),
+    ("divide", Decimal("10"), Decimal("2"), Decimal("5.00")),
+    ("power", Decimal("2"), Decimal("3"), Decimal("8.00")),
+    ("root", Decimal("27"), Decimal("3"), Decimal("3.00")),
+    ("modulus", Decimal("10"), Decimal("3"), Decimal("1.00")),
+    ("int_divide", Decimal("10"), Decimal("3"), Decimal("3.00")),
+    ("percent", Decimal("5"), Decimal("100"), Decimal("5.00")),
+    ("abs_diff", Decimal("5"), Decimal("10"), Decimal("5.00")),
+)
 
 
 # ===========================================================================
@@ -22,30 +55,26 @@ from app.exceptions import DivisionByZeroError, InvalidOperationError
 class TestCalculation:
     """Tests for the Calculation data model."""
 
-    @pytest.mark.parametrize(
-        "a, b, operation, op_name, expected",
-        [
-            (Decimal("5"), Decimal("3"), add, "add", Decimal("8.00")),
-            (Decimal("10"), Decimal("4"), subtract, "subtract", Decimal("6.00")),
-            (Decimal("6"), Decimal("7"), multiply, "multiply", Decimal("42.00")),
-            (Decimal("20"), Decimal("4"), divide, "divide", Decimal("5.00")),
-            (Decimal("2"), Decimal("8"), nth_power, "power", Decimal("256.00")),
-            (Decimal("9"), Decimal("2"), nth_root, "root", Decimal("3.00")),
-            (Decimal("10"), Decimal("3"), modulus, "modulus", Decimal("1.00")),
-            (Decimal("10"), Decimal("3"), int_divide, "int_divide", Decimal("3.00")),
-            (Decimal("5"), Decimal("100"), percent, "percent", Decimal("5.00")),
-            (Decimal("5"), Decimal("10"), abs_diff, "abs_diff", Decimal("5.00")),
-        ],
-    )
-    def test_calculation_result(
-        self, a, b, operation, op_name, expected
-    ) -> None:
-        """Test that Calculation computes the correct result."""
-        calc = Calculation(a, b, operation, op_name, precision=2)
-        assert calc.result == expected
-        assert calc.operand_a == a
-        assert calc.operand_b == b
-        assert calc.operation_name == op_name
+    def test_calculation_results(self) -> None:
+        """Calculation computes the correct result for every operation."""
+        calcs = [Calculation(a, b, op, name, precision=2) for a, b, op, name, _ in _CASES]
+        assert [c.result for c in calcs] == [expected for *_, expected in _CASES]
+        assert [(c.operand_a, c.operand_b, c.operation_name) for c in calcs] == [
+            (a, b, name) for a, b, _, name, _ in _CASES
+        ]
+
+    def test_float_path_matches_decimal(self) -> None:
+        """The float fast path agrees with Decimal for float-safe ops."""
+        cases = [case for case in _CASES if case[3] in FLOAT_SAFE_OPERATIONS]
+        assert [CalculationFactory.create_float(a, b, name).result for a, b, _, name, _ in cases] == [
+            expected for *_, expected in cases
+        ]
+
+    def test_result_is_decimal(self) -> None:
+        """Decimal operands produce a Decimal result quantized to precision."""
+        calc = Calculation(Decimal("9"), Decimal("2"), nth_root, "root", precision=2)
+        assert isinstance(calc.result, Decimal)
+        assert calc.result.as_tuple().exponent == -2
 
     def test_repr(self) -> None:
         """Test __repr__ output."""
@@ -69,6 +98,20 @@ class TestCalculation:
         assert expected_substring in result_str
         assert "=" in result_str
 
+    def test_str_unknown_operation(self) -> None:
+        """Names without a symbol fall back to the operation name."""
+        calc = Calculation(Decimal("2"), Decimal("3"), add, "custom")
+        assert str(calc) == "2 custom 3 = 5.00"
+
+    def test_symbols_cover_registry(self) -> None:
+        """Every registered operation has a precomputed display symbol."""
+        assert set(Calculation._SYMBOLS) == set(CalculationFactory.get_supported_operations())
+
+    def test_uses_slots(self) -> None:
+        """Calculation instances do not carry a per-instance __dict__."""
+        calc = Calculation(Decimal("2"), Decimal("3"), add, "add")
+        assert not hasattr(calc, "__dict__")
+
     def test_division_by_zero(self) -> None:
         """Creating a divide-by-zero Calculation raises DivisionByZeroError."""
         with pytest.raises(DivisionByZeroError):
@@ -88,31 +131,51 @@ class TestCalculation:
 class TestCalculationFactory:
     """Tests for the CalculationFactory."""
 
+    def test_create_valid(self) -> None:
+        """Factory creates correct Calculation instances for every operation."""
+        calcs = [CalculationFactory.create(a, b, name, precision=2) for name, a, b, _ in _FACTORY_CASES]
+        assert [c.result for c in calcs] == [expected for *_, expected in _FACTORY_CASES]
+        assert [c.operation_name for c in calcs] == [name for name, *_ in _FACTORY_CASES]
+
+    def test_create_unknown_operation(self) -> None:
+        """Unknown operation raises InvalidOperationError."""
+        with pytest.raises(InvalidOperationError):
+            CalculationFactory.create(Decimal("1"), Decimal("2"), "unknown")
+
     @pytest.mark.parametrize(
         "op_name, a, b, expected",
         [
-            ("add", Decimal("2"), Decimal("3"), Decimal("5.00")),
-            ("subtract", Decimal("10"), Decimal("3"), Decimal("7.00")),
-            ("multiply", Decimal("4"), Decimal("5"), Decimal("20.00")),
-            ("divide", Decimal("10"), Decimal("2"), Decimal("5.00")),
-            ("power", Decimal("2"), Decimal("3"), Decimal("8.00")),
-            ("root", Decimal("27"), Decimal("3"), Decimal("3.00")),
-            ("modulus", Decimal("10"), Decimal("3"), Decimal("1.00")),
-            ("int_divide", Decimal("10"), Decimal("3"), Decimal("3.00")),
-            ("percent", Decimal("5"), Decimal("100"), Decimal("5.00")),
-            ("abs_diff", Decimal("5"), Decimal("10"), Decimal("5.00")),
+            ("add", Decimal("2"), Decimal("3"), 5.0),
+            ("subtract", Decimal("10"), Decimal("3"), 7.0),
+            ("multiply", Decimal("4"), Decimal("5"), 20.0),
+            ("divide", Decimal("10"), Decimal("4"), 2.5),
+            ("power", Decimal("2"), Decimal("3"), 8.0),
         ],
     )
-    def test_create_valid(self, op_name, a, b, expected) -> None:
-        """Factory creates correct Calculation instances."""
-        calc = CalculationFactory.create(a, b, op_name, precision=2)
+    def test_create_float(self, op_name, a, b, expected) -> None:
+        """Factory creates float-based Calculations for fast mode."""
+        calc = CalculationFactory.create_float(a, b, op_name, precision=2)
+        assert type(calc.operation(a, b)) is float
+        assert isinstance(calc.result, Decimal)
         assert calc.result == expected
-        assert calc.operation_name == op_name
+        assert str(calc) == f"{a} {calc._symbol} {b} = {expected:.2f}"
 
-    def test_create_unknown_operation(self) -> None:
-        """Unknown operation raises InvalidOperationError."""
+    def test_create_float_unsupported_operation(self) -> None:
+        """Operations without a float fast path are rejected."""
         with pytest.raises(InvalidOperationError):
-            CalculationFactory.create(Decimal("1"), Decimal("2"), "unknown")
+            CalculationFactory.create_float(10.0, 3.0, "modulus")
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            pytest.param(-8.0, 0.5, id="complex"),
+            pytest.param(10.0, 400.0, id="overflow"),
+        ],
+    )
+    def test_create_float_invalid_result(self, a, b) -> None:
+        """Non-real or overflowing float results raise OperationError."""
+        with pytest.raises(OperationError):
+            CalculationFactory.create_float(a, b, "power")
 
     def test_get_supported_operations(self) -> None:
         """All operations are returned."""
@@ -9,7 +9,7 @@ boolean/integer/float parsing, and error handling.
 import os
 import pytest
 
-from app.calculator_config import CalculatorConfig
+from app.calculator_config import CalculatorConfig, _load_env
 from app.exceptions import ConfigurationError
 
 
@@ -29,6 +29,7 @@ def env_file(tmp_path):
         "CALCULATOR_MAX_HISTORY_SIZE=500\n"
         "CALCULATOR_AUTO_SAVE=true\n"
         "CALCULATOR_PRECISION=3\n"
+        "CALCULATOR_ARITHMETIC_MODE=fast\n"
         "CALCULATOR_MAX_INPUT_VALUE=1e5\n"
         "CALCULATOR_DEFAULT_ENCODING=utf-16\n"
     )
@@ -41,7 +42,8 @@ def clean_env():
     keys = [
         "CALCULATOR_LOG_DIR", "CALCULATOR_LOG_FILE", "CALCULATOR_HISTORY_DIR",
         "CALCULATOR_MAX_HISTORY_SIZE", "CALCULATOR_AUTO_SAVE", "CALCULATOR_PRECISION",
-        "CALCULATOR_MAX_INPUT_VALUE", "CALCULATOR_DEFAULT_ENCODING"
+        "CALCULATOR_MAX_INPUT_VALUE", "CALCULATOR_DEFAULT_ENCODING",
+        "CALCULATOR_ARITHMETIC_MODE",
     ]
     saved = {}
     for k in keys:
@@ -71,6 +73,7 @@ class TestConfigLoading:
         assert cfg.max_history_size == 1000
         assert cfg.auto_save is True
         assert cfg.precision == 2
+        assert cfg.arithmetic_mode == "exact"
         assert cfg.max_input_value == 1e10
         assert cfg.default_encoding == "utf-8"
 
@@ -83,6 +86,7 @@ class TestConfigLoading:
         assert cfg.max_history_size == 500
         assert cfg.auto_save is True
         assert cfg.precision == 3
+        assert cfg.arithmetic_mode == "fast"
         assert cfg.max_input_value == 1e5
         assert cfg.default_encoding == "utf-16"
 
@@ -95,6 +99,40 @@ class TestConfigLoading:
         assert "precision=3" in r
 
 
+    def test_env_file_overrides_environment(self, env_file: str, monkeypatch) -> None:
+        """Values from the .env file take precedence over the environment."""
+        monkeypatch.setenv("CALCULATOR_LOG_DIR", "env_logs")
+        monkeypatch.setenv("CALCULATOR_HISTORY_FILE", "env_history.csv")
+        cfg = CalculatorConfig(env_path=env_file)
+        assert cfg.log_dir == "test_logs"
+        assert cfg.history_file == "env_history.csv"
+
+
+# ---------------------------------------------------------------------------
+# .env caching
+# ---------------------------------------------------------------------------
+
+
+class TestEnvCache:
+    """Tests for the cached .env parsing."""
+
+    def test_unchanged_file_is_cached(self, env_file: str) -> None:
+        """Re-instantiating with an unchanged .env file hits the cache."""
+        CalculatorConfig(env_path=env_file)
+        hits = _load_env.cache_info().hits
+        CalculatorConfig(env_path=env_file)
+        assert _load_env.cache_info().hits == hits + 1
+
+    def test_modified_file_is_reloaded(self, env_file: str) -> None:
+        """Changing the .env file's mtime invalidates the cached values."""
+        assert CalculatorConfig(env_path=env_file).precision == 3
+        with open(env_file, "a") as fh:
+            fh.write("CALCULATOR_PRECISION=5\n")
+        stat = os.stat(env_file)
+        os.utime(env_file, (stat.st_atime, stat.st_mtime + 10))
+        assert CalculatorConfig(env_path=env_file).precision == 5
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -118,9 +156,16 @@ class TestParsers:
     def test_parse_bool(self):
         assert CalculatorConfig._parse_bool("true", "TEST") is True
         assert CalculatorConfig._parse_bool("false", "TEST") is False
+        assert CalculatorConfig._parse_bool(" YES ", "TEST") is True
+        assert CalculatorConfig._parse_bool("0", "TEST") is False
         with pytest.raises(ConfigurationError):
             CalculatorConfig._parse_bool("abc", "TEST")
 
+    def test_parse_choice(self):
+        assert CalculatorConfig._parse_choice(" Fast ", "TEST", ("exact", "fast")) == "fast"
+        with pytest.raises(ConfigurationError):
+            CalculatorConfig._parse_choice("abc", "TEST", ("exact", "fast"))
+
     def test_parse_positive_int(self):
         assert CalculatorConfig._parse_positive_int("1", "TEST") == 1
         with pytest.raises(ConfigurationError):
@@ -3,11 +3,10 @@ Tests for the Calculator Memento Module
 =========================================
 
 Tests for CalculatorMemento and MementoCaretaker — undo/redo
-functionality over the pandas-backed CalculationHistory.
+functionality over the row-based CalculationHistory.
 """
 
 import pytest
-import pandas as pd
 from decimal import Decimal
 
 from app.calculation import Calculation
@@ -16,6 +15,10 @@ from app.history import CalculationHistory
 from app.calculator_memento import CalculatorMemento, MementoCaretaker
 
 
+# Operand constants shared by the fixtures
+_D2, _D3, _D10, _D4 = Decimal("2"), Decimal("3"), Decimal("10"), Decimal("4")
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -31,14 +34,14 @@ def caretaker(history: CalculationHistory) -> MementoCaretaker:
     return MementoCaretaker(history)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_calc() -> Calculation:
-    return Calculation(Decimal("2"), Decimal("3"), add, "add", precision=2)
+    return Calculation(_D2, _D3, add, "add", precision=2)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_calc2() -> Calculation:
-    return Calculation(Decimal("10"), Decimal("4"), subtract, "subtract", precision=2)
+    return Calculation(_D10, _D4, subtract, "subtract", precision=2)
 
 
 # ---------------------------------------------------------------------------
@@ -50,15 +53,15 @@ class TestCalculatorMemento:
     """Tests for the CalculatorMemento snapshot."""
 
     def test_memento_stores_copy(self) -> None:
-        """Memento stores a copy of the DataFrame, not a reference."""
-        original = pd.DataFrame([{"a": 1}])
+        """Memento stores a copy of the rows, not a reference."""
+        original = [{"a": 1}]
         memento = CalculatorMemento(original)
-        original.drop(index=0, inplace=True)
-        assert len(memento.dataframe) == 1
+        original.clear()
+        assert len(memento.rows) == 1
 
     def test_repr(self) -> None:
         """Repr shows row count."""
-        memento = CalculatorMemento(pd.DataFrame([{"a": 1}, {"a": 2}]))
+        memento = CalculatorMemento(({"a": 1}, {"a": 2}))
         assert "2 rows" in repr(memento)
 
 
@@ -97,6 +100,23 @@ class TestMementoUndo:
         assert caretaker.can_undo is True
 
 
+    def test_max_depth_drops_oldest(
+        self,
+        history: CalculationHistory,
+        sample_calc: Calculation,
+    ) -> None:
+        """Only the most recent max_depth snapshots are kept."""
+        caretaker = MementoCaretaker(history, max_depth=2)
+        for _ in range(3):
+            caretaker.save()
+            history.add(sample_calc)
+
+        assert caretaker.undo() is True
+        assert caretaker.undo() is True
+        assert caretaker.undo() is False
+        assert len(history) == 1
+
+
 # ---------------------------------------------------------------------------
 # MementoCaretaker — redo
 # ---------------------------------------------------------------------------
@@ -182,3 +202,20 @@ class TestUndoRedoInteraction:
 
         caretaker.undo()  # back to 0 rows
         assert len(history) == 0
+
+    def test_clear_discards_snapshots(
+        self,
+        history: CalculationHistory,
+        caretaker: MementoCaretaker,
+        sample_calc: Calculation,
+    ) -> None:
+        """clear() empties both stacks without touching the history."""
+        caretaker.save()
+        history.add(sample_calc)
+        caretaker.save()
+        caretaker.undo()
+
+        caretaker.clear()
+        assert caretaker.can_undo is False
+        assert caretaker.can_redo is False
+        assert len(history) == 1
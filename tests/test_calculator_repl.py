@@ -9,42 +9,127 @@ Tests for the Calculator facade class, covering:
 - Error handling
 """
 
+from __future__ import annotations
+
+import os
+import re
 import pytest
 from decimal import Decimal
+from typing import TYPE_CHECKING
 from unittest.mock import patch, MagicMock
 
-from app.calculator_repl import Calculator
 from app.exceptions import CalculationError, ConfigurationError
-from app.calculator_config import CalculatorConfig
+
+if TYPE_CHECKING:
+    # Imported where used, so collecting this module doesn't load the REPL
+    from app.calculator_repl import Calculator
+
+
+def _make_calculator(tmp_path, auto_save: bool) -> Calculator:
+    """Build a Calculator configured through environment variables.
+
+    ``env_path=""`` disables ``.env`` lookup, so only the variables set here
+    (and the process environment) apply; they are restored once the
+    Calculator has read its config.
+    """
+    from app.calculator_repl import Calculator
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("CALCULATOR_LOG_DIR", str(tmp_path / "logs"))
+        mp.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path / "data"))
+        mp.setenv("CALCULATOR_AUTO_SAVE", str(auto_save).lower())
+        mp.setenv("CALCULATOR_PRECISION", "2")
+        return Calculator(env_path="")
+
+
+@pytest.fixture(scope="module")
+def calculator(request, tmp_path_factory):
+    """Provide a Calculator shared by this module (reset by ``_reset_calculator``).
+
+    Auto-save is off by default so the shared instance never writes between
+    tests; parametrize ``calculator`` indirectly with ``[True]`` to enable it.
+    """
+    auto_save = getattr(request, "param", False)
+    return _make_calculator(tmp_path_factory.mktemp("calc"), auto_save=auto_save)
+
+
+@pytest.fixture(autouse=True)
+def _reset_calculator(calculator: Calculator):
+    """Give each test an empty history, empty undo/redo stacks and default config."""
+    arithmetic_mode = calculator.config.arithmetic_mode
+    calculator.history.clear()
+    calculator.caretaker.clear()
+    calculator.auto_save_observer.mark_saved()
+    yield
+    calculator.config.arithmetic_mode = arithmetic_mode
 
 
 @pytest.fixture
-def calculator(tmp_path):
-    """Provide a Calculator instance configured for testing."""
-    env = tmp_path / ".env"
-    env.write_text(
-        f"CALCULATOR_LOG_DIR={tmp_path}/logs\n"
-        f"CALCULATOR_HISTORY_DIR={tmp_path}/data\n"
-        "CALCULATOR_AUTO_SAVE=true\n"
-        "CALCULATOR_PRECISION=2\n"
-    )
-    return Calculator(env_path=str(env))
+def inject_factory_error():
+    """Make ``CalculationFactory.create`` raise a ``CalculationError``."""
+    with patch(
+        "app.calculator_repl.CalculationFactory.create",
+        side_effect=CalculationError("Injected error"),
+    ) as mock_create:
+        yield mock_create
+
+
+# (input, expected message fragment) for test_invalid_input
+_INVALID_INPUTS = (
+    ("unknown 1 2", "Unknown operation"),
+    ("add abc 1", "not a valid number"),
+    ("add a b", "not a valid number"),
+    ("add 1", "Invalid format"),
+    ("add 1 2 3", "Invalid format"),
+)
+
+# Patterns for the longer command outputs, compiled once for the module
+_HELP_RE = re.compile("Calculator Help")
+_SAVED_RE = re.compile(r"history saved", re.I)
+
+_SEED_ROW = {
+    "timestamp": "2024-01-01 00:00:00",
+    "operand_a": "1",
+    "operand_b": "2",
+    "operation": "add",
+    "result": "3.00",
+}
+
+
+def _seed(calculator: Calculator, n: int = 1) -> None:
+    """Put *n* rows in the history without going through ``process_input``.
+
+    A memento is saved first, as ``process_input`` would, so undo works.
+    """
+    calculator.caretaker.save()
+    calculator.history.set_rows((_SEED_ROW,) * n)
 
 
 class TestCalculatorREPL:
     """Integration tests for the Calculator REPL."""
 
-    def test_process_input_arithmetic(self, calculator: Calculator) -> None:
-        """Arithmetic commands compute correctly and add to history."""
-        result = calculator.process_input("add 5 3")
-        assert "8.00" in result
+    @pytest.mark.parametrize(
+        "user_input, expected",
+        [
+            pytest.param("add 5 3", "= 8.00", id="add"),
+            pytest.param("  ADD 5 3  ", "= 8.00", id="upper-padded"),
+            pytest.param("Add 1E0 1e0", "= 2.00", id="mixed-case-exponent"),
+        ],
+    )
+    def test_process_input_arithmetic(
+        self, calculator: Calculator, user_input: str, expected: str
+    ) -> None:
+        """Arithmetic commands (any case, any surrounding whitespace) compute
+        correctly and add one entry to history."""
+        assert expected in calculator.process_input(user_input)
         assert len(calculator.history) == 1
 
     def test_process_input_special_commands(self, calculator: Calculator) -> None:
         """Special commands return expected output."""
-        assert "Calculator Help" in calculator.process_input("help")
+        assert _HELP_RE.search(calculator.process_input("help"))
+        assert _HELP_RE.search(calculator.process_input(" HELP "))
 
-        calculator.process_input("add 1 1")
+        _seed(calculator)
         assert "Calculation History" in calculator.process_input("history")
 
         assert "History cleared" in calculator.process_input("clear")
@@ -57,7 +142,7 @@ class TestCalculatorREPL:
 
     def test_undo_redo(self, calculator: Calculator) -> None:
         """Undo and redo commands work through the caretaker."""
-        calculator.process_input("add 5 3")
+        _seed(calculator)
         assert len(calculator.history) == 1
 
         calculator.process_input("undo")
@@ -71,15 +156,18 @@ class TestCalculatorREPL:
         assert "Nothing to undo" in calculator.process_input("undo")
         assert "Nothing to redo" in calculator.process_input("redo")
 
-    def test_invalid_input(self, calculator: Calculator) -> None:
-        """Invalid commands/operands return error messages."""
-        assert "Unknown operation" in calculator.process_input("unknown 1 2")
-        assert "not a valid number" in calculator.process_input("add abc 1")
+    def test_invalid_input(self, calculator: Calculator, subtests) -> None:
+        """Invalid commands, formats and operands return error messages."""
+        for user_input, expected in _INVALID_INPUTS:
+            with subtests.test(user_input=user_input):
+                assert expected in calculator.process_input(user_input)
+        assert len(calculator.history) == 0
 
+    @pytest.mark.slow
     def test_save_load(self, calculator: Calculator) -> None:
         """Manual save and load commands work."""
-        calculator.process_input("add 10 5")
-        assert "History saved" in calculator.process_input("save")
+        _seed(calculator)
+        assert _SAVED_RE.search(calculator.process_input("save"))
 
         calculator.process_input("clear")
         assert len(calculator.history) == 0
@@ -87,23 +175,64 @@ class TestCalculatorREPL:
         assert "Loaded 1" in calculator.process_input("load")
         assert len(calculator.history) == 1
 
+    @pytest.mark.parametrize("command, method", [("save", "save_to_csv"), ("load", "load_from_csv")])
+    def test_save_load_errors_reported(self, calculator: Calculator, command: str, method: str) -> None:
+        """File errors from save / load (e.g. a failed background save) are reported."""
+        with patch.object(calculator.history, method, side_effect=OSError("disk full")):
+            assert calculator.process_input(command) == "Error: disk full"
+
+    def test_exit_flush_error_reported(self, calculator: Calculator, capsys) -> None:
+        """A failed auto-save flush on exit is printed instead of raised."""
+        with patch.object(type(calculator.auto_save_observer), "flush", side_effect=OSError("disk full")):
+            calculator._flush_auto_save()
+        assert capsys.readouterr().out == "Error: disk full\n"
+
+    def test_auto_save_disabled_by_default(self, calculator: Calculator) -> None:
+        """The default calculator fixture does not auto-save."""
+        assert calculator.auto_save_observer.enabled is False
+
     def test_process_input_empty(self, calculator: Calculator) -> None:
         """Test that empty input is handled correctly."""
         assert calculator.process_input("") == ""
 
-    def test_process_input_invalid_operation(self, calculator: Calculator) -> None:
-        """Test that InvalidOperation is handled correctly."""
-        assert "not a valid number" in calculator.process_input("add a b")
-
     def test_process_input_calculation_error(self, calculator: Calculator) -> None:
         """Test that CalculationError is handled correctly."""
         assert "Error: Division by zero" in calculator.process_input("divide 1 0")
 
+    def test_calculation_error_from_factory(self, calculator: Calculator, inject_factory_error) -> None:
+        """Errors raised by the factory are reported and nothing is recorded."""
+        assert calculator.process_input("add 1 2") == "Error: Injected error"
+        assert len(calculator.history) == 0
+
     def test_handle_history_empty(self, calculator: Calculator) -> None:
         """Test that _handle_history works correctly with empty history."""
         assert "No calculations in history" in calculator.process_input("history")
 
-    def test_configuration_error_fallback(self, monkeypatch) -> None:
+    def test_fast_arithmetic_mode(self, calculator: Calculator) -> None:
+        """Fast mode uses floats for float-safe operations only."""
+        from app.calculation import CalculationFactory
+
+        calculator.config.arithmetic_mode = "fast"
+        with patch(
+            "app.calculator_repl.CalculationFactory.create_float",
+            wraps=CalculationFactory.create_float,
+        ) as create_float:
+            assert calculator.process_input("add 5 3") == "Result: 5 + 3 = 8.00"
+            assert create_float.call_count == 1
+            assert calculator.process_input("modulus 10 3") == "Result: 10 % 3 = 1.00"
+            assert calculator.process_input("add 1.00000000000000001 1") == (
+                "Result: 1.00000000000000001 + 1 = 2.00"
+            )
+            assert create_float.call_count == 1
+        row = calculator.history.get_all()[0]
+        assert (row["operand_a"], row["operand_b"], row["result"]) == ("5", "3", "8.00")
+
+    def test_configuration_error_fallback(self, monkeypatch, tmp_path) -> None:
+        from app.calculator_config import CalculatorConfig
+        from app.calculator_repl import Calculator
+
+        monkeypatch.chdir(tmp_path)
+
         class MockCalculatorConfig(CalculatorConfig):
             _call_count = 0
             def __init__(self, env_path=None):
@@ -116,3 +245,21 @@ class TestCalculatorREPL:
         calculator = Calculator()
         assert calculator.config is not None
         assert isinstance(calculator.config, MockCalculatorConfig)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("calculator", [True], indirect=True)
+class TestAutoSave:
+    """Auto-save integration, on an auto-saving Calculator built once."""
+
+    def test_auto_save_observer_registered(self, calculator: Calculator) -> None:
+        """The enabled auto-save observer is attached to the history."""
+        observer = calculator.auto_save_observer
+        assert observer.enabled is True
+        assert observer in calculator.history._observers
+
+    def test_auto_save_flush_writes_history(self, calculator: Calculator) -> None:
+        """Pending calculations are on disk once the observer is flushed."""
+        calculator.process_input("add 2 2")
+        calculator.auto_save_observer.flush()
+        assert os.path.exists(calculator.history.csv_path)
@@ -0,0 +1,41 @@
+"""
+Tests for the Exceptions Module
+================================
+
+Checks that every custom exception derives from ``CalculationError`` and
+can be raised with a message.
+"""
+
+import re
+
+import pytest
+
+from app.exceptions import (
+    CalculationError,
+    ConfigurationError,
+    DivisionByZeroError,
+    InvalidInputError,
+    InvalidOperationError,
+    OperationError,
+    ValidationError,
+)
+
+
+# Patterns are compiled once at collection rather than by each raises()
+@pytest.mark.parametrize(
+    "exc_class, message",
+    [
+        (CalculationError, re.compile("base error")),
+        (InvalidOperationError, re.compile("unknown operation")),
+        (InvalidInputError, re.compile("bad input")),
+        (DivisionByZeroError, re.compile("division by zero")),
+        (ConfigurationError, re.compile("bad config")),
+        (OperationError, re.compile("operation failed")),
+        (ValidationError, re.compile("validation failed")),
+    ],
+)
+def test_exception_hierarchy_and_message(exc_class: type, message: re.Pattern) -> None:
+    """Each exception is a CalculationError and carries its message."""
+    assert issubclass(exc_class, CalculationError)
+    with pytest.raises(exc_class, match=message):
+        raise exc_class(message.pattern)
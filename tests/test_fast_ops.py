@@ -0,0 +1,47 @@
+"""
+Tests for the Fast Operations Module
+=====================================
+
+Tests for the scalar float operations and ``get_operation(fast=True)``.
+"""
+
+import pytest
+
+from app.exceptions import DivisionByZeroError, InvalidOperationError
+from app.fast_ops import FAST_OPERATIONS
+from app.operations import get_operation
+
+
+# ---------------------------------------------------------------------------
+# Scalar fast operations
+# ---------------------------------------------------------------------------
+
+
+class TestFastOperations:
+    """Tests for FAST_OPERATIONS and get_operation(fast=True)."""
+
+    @pytest.mark.parametrize(
+        "name, a, b, expected",
+        [
+            ("add", 5.0, 3.0, 8.0),
+            ("subtract", 10.0, 4.0, 6.0),
+            ("multiply", 6.0, 7.0, 42.0),
+            ("divide", 20.0, 4.0, 5.0),
+            ("power", 2.0, 8.0, 256.0),
+        ],
+    )
+    def test_fast_operation(self, name: str, a: float, b: float, expected: float) -> None:
+        """get_operation(fast=True) returns the float implementation."""
+        func = get_operation(name, fast=True)
+        assert func is FAST_OPERATIONS[name]
+        assert func(a, b) == pytest.approx(expected)
+
+    def test_fast_divide_by_zero(self) -> None:
+        """The fast divide rejects a zero divisor."""
+        with pytest.raises(DivisionByZeroError):
+            FAST_OPERATIONS["divide"](1.0, 0.0)
+
+    def test_no_fast_implementation(self) -> None:
+        """Operations outside FAST_OPERATIONS are rejected."""
+        with pytest.raises(InvalidOperationError):
+            get_operation("modulus", fast=True)
@@ -2,13 +2,15 @@
 Tests for the History Module
 ==============================
 
-Tests for CalculationHistory (pandas-backed), observer notifications,
-LoggingObserver, CSV save/load, and DataFrame get/set.
+Tests for CalculationHistory, observer notifications, LoggingObserver,
+CSV save/load, and DataFrame get/set.
 """
 
+import io
 import os
+import subprocess
+import sys
 import pytest
-import pandas as pd
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 import logging
@@ -23,6 +25,21 @@ from app.history import (
 )
 
 
+# Operand constants shared by the fixtures
+_D2, _D3 = Decimal("2"), Decimal("3")
+
+# A prebuilt history row, for tests that only need rows to persist
+_ONE_ROW = (
+    {
+        "timestamp": "2024-01-01 00:00:00",
+        "operand_a": "2",
+        "operand_b": "3",
+        "operation": "add",
+        "result": "5.00",
+    },
+)
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
@@ -42,10 +59,39 @@ def history(history_setup) -> CalculationHistory:
     return CalculationHistory(history_dir=history_dir, history_file="test_history.csv")
 
 
+class _StubObserver(CalculationObserver):
+    """Observer that records the calculations it is notified about."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[Calculation] = []
+
+    def on_calculation(self, calculation: Calculation) -> None:
+        self.calls.append(calculation)
+
+
 @pytest.fixture
+def fail_next_background_write(monkeypatch) -> None:
+    """Make the next background CSV write raise ``OSError``."""
+    from app import async_writer
+
+    real_write = async_writer.write_csv_rows
+    failed = []
+
+    def flaky_write(*args) -> None:
+        if not failed:
+            failed.append(args)
+            raise OSError("disk full")
+        real_write(*args)
+
+    monkeypatch.setattr(async_writer, "write_csv_rows", flaky_write)
+
+
+@pytest.fixture(scope="module")
 def sample_calc() -> Calculation:
     """Provide a sample add calculation."""
-    return Calculation(Decimal("2"), Decimal("3"), add, "add", precision=2)
+    return Calculation(_D2, _D3, add, "add", precision=2)
 
 
 # ---------------------------------------------------------------------------
@@ -71,6 +117,14 @@ class TestCalculationHistoryBasics:
         assert rows[0]["operation"] == "add"
         assert "timestamp" in rows[0]
 
+    def test_get_all_returns_copy(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """Mutating the list from get_all does not change the history."""
+        history.add(sample_calc)
+        history.get_all().clear()
+        assert len(history) == 1
+
     def test_clear(
         self, history: CalculationHistory, sample_calc: Calculation
     ) -> None:
@@ -79,6 +133,38 @@ class TestCalculationHistoryBasics:
         history.clear()
         assert len(history) == 0
 
+    def test_get_dataframe_reflects_rows(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """get_dataframe builds a DataFrame with the expected columns."""
+        assert list(history.get_dataframe().columns) == CalculationHistory._COLUMNS
+        history.add(sample_calc)
+        df = history.get_dataframe()
+        assert len(df) == 1
+        assert df.iloc[0]["result"] == "5.00"
+
+    def test_get_and_set_rows(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """get_rows returns a snapshot that set_rows can restore."""
+        history.add(sample_calc)
+        snapshot = history.get_rows()
+        assert isinstance(snapshot, tuple)
+        history.clear()
+        assert len(snapshot) == 1
+        history.set_rows(snapshot)
+        assert len(history) == 1
+
+    @pytest.mark.slow
+    def test_import_does_not_load_pandas(self) -> None:
+        """pandas and numpy are only imported once they are needed."""
+        code = (
+            "import sys, app.calculator_repl; "
+            "sys.exit('pandas' in sys.modules or 'numpy' in sys.modules)"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
     def test_repr(self, history: CalculationHistory) -> None:
         """Repr shows count."""
         assert "0 calculations" in repr(history)
@@ -105,20 +191,20 @@ class TestObserverPattern:
         self, history: CalculationHistory, sample_calc: Calculation
     ) -> None:
         """Observer's on_calculation is called when a calc is added."""
-        mock_observer = MagicMock(spec=CalculationObserver)
-        history.add_observer(mock_observer)
+        observer = _StubObserver()
+        history.add_observer(observer)
         history.add(sample_calc)
-        mock_observer.on_calculation.assert_called_once_with(sample_calc)
+        assert observer.calls == [sample_calc]
 
     def test_remove_observer(
         self, history: CalculationHistory, sample_calc: Calculation
     ) -> None:
         """Test that a removed observer is not notified."""
-        mock_observer = MagicMock(spec=CalculationObserver)
-        history.add_observer(mock_observer)
-        history.remove_observer(mock_observer)
+        observer = _StubObserver()
+        history.add_observer(observer)
+        history.remove_observer(observer)
         history.add(sample_calc)
-        mock_observer.on_calculation.assert_not_called()
+        assert observer.calls == []
 
 
 # ---------------------------------------------------------------------------
@@ -141,6 +227,16 @@ class TestLoggingObserver:
             observer.on_calculation(sample_calc)
             mock_logger.info.assert_called_once()
 
+    def test_skips_disabled_level(self, sample_calc: Calculation, history_setup) -> None:
+        """Nothing is logged when INFO is disabled for the logger."""
+        _, log_dir = history_setup
+        observer = LoggingObserver(log_dir=log_dir)
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = False
+        observer.logger = mock_logger
+        observer.on_calculation(sample_calc)
+        mock_logger.info.assert_not_called()
+
     def test_logging_observer_init_no_dir(self, tmp_path) -> None:
         """Test that the LoggingObserver creates the log directory if it doesn't exist."""
         log_dir = tmp_path / "logs"
@@ -157,17 +253,75 @@ class TestLoggingObserver:
 class TestCSVPersistence:
     """Tests for save_to_csv and load_from_csv."""
 
-    def test_save_and_load(
-        self, history: CalculationHistory, sample_calc: Calculation
-    ) -> None:
+    @pytest.mark.slow
+    def test_save_and_load(self, history: CalculationHistory) -> None:
         """Saving and loading preserves data."""
-        history.add(sample_calc)
+        history.set_rows(_ONE_ROW)
         history.save_to_csv()
 
         new_history = CalculationHistory(history_dir=history.history_dir, history_file=history.history_file)
         count = new_history.load_from_csv()
         assert count == 1
-        assert len(new_history) == 1
+        assert new_history.get_rows() == _ONE_ROW
+
+    def test_save_appends_new_rows(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """Repeated saves to the same file append only the new rows."""
+        history.add(sample_calc)
+        history.save_to_csv()
+        history.add(sample_calc)
+        history.save_to_csv()
+        with open(history.csv_path, encoding="utf-8") as fh:
+            assert fh.read().count("timestamp") == 1
+
+        new_history = CalculationHistory(history_dir=history.history_dir, history_file=history.history_file)
+        assert new_history.load_from_csv() == 2
+
+    def test_save_rewrites_after_clear(self, history: CalculationHistory) -> None:
+        """Saving after the rows were replaced rewrites the whole file."""
+        history.set_rows(_ONE_ROW * 2)
+        history.save_to_csv()
+        history.clear()
+        history.set_rows(_ONE_ROW)
+        history.save_to_csv()
+
+        new_history = CalculationHistory(history_dir=history.history_dir, history_file=history.history_file)
+        assert new_history.load_from_csv() == 1
+
+    def test_background_save_error_surfaces(self, history: CalculationHistory, tmp_path) -> None:
+        """Errors from background writes are raised by wait_for_writes."""
+        target = tmp_path / "dir_not_file"
+        target.mkdir()
+        history.save_to_csv(str(target), background=True)
+        with pytest.raises(OSError):
+            history.wait_for_writes()
+
+    def test_failed_background_save_is_rewritten(
+        self, history: CalculationHistory, sample_calc: Calculation, fail_next_background_write
+    ) -> None:
+        """A failed background write is raised once; the next save rewrites the file."""
+        history.add(sample_calc)
+        history.save_to_csv()
+        history.add(sample_calc)
+        history.save_to_csv(background=True)
+        history.add(sample_calc)
+        with pytest.raises(OSError, match="disk full"):
+            history.save_to_csv()
+        history.save_to_csv()
+
+        new_history = CalculationHistory(history_dir=history.history_dir, history_file=history.history_file)
+        assert new_history.load_from_csv() == 3
+
+    def test_load_after_failed_background_save(
+        self, history: CalculationHistory, sample_calc: Calculation, fail_next_background_write
+    ) -> None:
+        """Loading raises a failed background write before reading the file."""
+        history.add(sample_calc)
+        history.save_to_csv(background=True)
+        with pytest.raises(OSError, match="disk full"):
+            history.load_from_csv()
+        assert history.load_from_csv() == 0
 
     def test_load_nonexistent_file(self, history: CalculationHistory) -> None:
         """Loading from a nonexistent file returns 0."""
@@ -176,9 +330,61 @@ class TestCSVPersistence:
 
     def test_auto_save_observer(self, history: CalculationHistory, sample_calc: Calculation):
         """Test that the auto save observer saves the history."""
+        observer = AutoSaveObserver(history, enabled=True, batch_size=1)
+        history.add_observer(observer)
+        history.add(sample_calc)
+        assert os.path.exists(history.csv_path)
+
+    def test_auto_save_observer_batches_writes(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """Test that the auto save observer only writes once a batch is full."""
+        observer = AutoSaveObserver(history, enabled=True, batch_size=2)
+        history.add_observer(observer)
+        history.add(sample_calc)
+        assert not os.path.exists(history.csv_path)
+        history.add(sample_calc)
+        assert os.path.exists(history.csv_path)
+
+    def test_auto_save_observer_background(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """Background batch saves are on disk once flush returns."""
+        observer = AutoSaveObserver(history, enabled=True, batch_size=1, background=True)
+        history.add_observer(observer)
+        history.add(sample_calc)
+        history.add(sample_calc)
+        observer.flush()
+
+        new_history = CalculationHistory(history_dir=history.history_dir, history_file=history.history_file)
+        assert new_history.load_from_csv() == 2
+
+    def test_auto_save_observer_flush_after_failed_background_save(
+        self, history: CalculationHistory, sample_calc: Calculation, fail_next_background_write
+    ) -> None:
+        """flush raises a failed background batch save; the next flush rewrites it."""
+        observer = AutoSaveObserver(history, enabled=True, batch_size=1, background=True)
+        history.add_observer(observer)
+        history.add(sample_calc)
+        with pytest.raises(OSError, match="disk full"):
+            observer.flush()
+        observer.flush()
+
+        new_history = CalculationHistory(history_dir=history.history_dir, history_file=history.history_file)
+        assert new_history.load_from_csv() == 1
+
+    def test_auto_save_observer_flush(
+        self, history: CalculationHistory, sample_calc: Calculation
+    ) -> None:
+        """Test that flush writes pending calculations and mark_saved discards them."""
         observer = AutoSaveObserver(history, enabled=True)
         history.add_observer(observer)
         history.add(sample_calc)
+        observer.mark_saved()
+        observer.flush()
+        assert not os.path.exists(history.csv_path)
+        history.add(sample_calc)
+        observer.flush()
         assert os.path.exists(history.csv_path)
 
     def test_auto_save_observer_disabled(
@@ -192,15 +398,13 @@ class TestCSVPersistence:
 
     def test_load_malformed_csv(self, history: CalculationHistory) -> None:
         """Test that loading a malformed CSV file returns 0."""
-        with patch('pandas.read_csv', side_effect=Exception("Mocked error")):
-            count = history.load_from_csv()
+        with patch('app.history.csv.DictReader', side_effect=Exception("Mocked error")):
+            count = history.load_from_csv(io.StringIO("timestamp,result\n"))
             assert count == 0
 
     def test_load_csv_with_missing_columns(self, history: CalculationHistory) -> None:
         """Test that loading a CSV with missing columns still works."""
-        df = pd.DataFrame({"a": [1], "b": [2]})
-        df.to_csv(history.csv_path, index=False)
-        count = history.load_from_csv()
+        count = history.load_from_csv(io.StringIO("a,b\n1,2\n"))
         assert count == 1
         assert "result" in history.get_dataframe().columns
 
@@ -8,7 +8,17 @@ Parameterized tests for LBYL validation helpers.
 import pytest
 from decimal import Decimal
 
-from app.input_validators import validate_input_parts, validate_numeric
+from app.input_validators import _unknown_op_error, validate_input_parts, validate_numeric
+
+
+# (input string, expected Decimal) pairs for TestValidateNumeric
+_VALID_NUMBERS = (
+    ("5", Decimal("5")),
+    ("-3.14", Decimal("-3.14")),
+    ("0", Decimal("0")),
+    ("1e3", Decimal("1000")),
+    ("+.5", Decimal("0.5")),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +51,14 @@ class TestValidateInputParts:
         """Unknown operation name returns an error."""
         assert validate_input_parts(["unknown", "1", "2"]) is not None
 
+    def test_unknown_operation_message_cached(self) -> None:
+        """Repeated unknown names reuse the memoized error message."""
+        _unknown_op_error.cache_clear()
+        first = validate_input_parts(["sqrt", "1", "2"])
+        assert validate_input_parts(["sqrt", "1", "2"]) is first
+        assert "Unknown operation 'sqrt'" in first
+        assert _unknown_op_error.cache_info().hits == 1
+
     def test_range_validation(self) -> None:
         """Operands exceeding max_value return an error."""
         assert validate_input_parts(["add", "1e11", "1"], max_value=1e10) is not None
@@ -61,22 +79,36 @@ class TestValidateInputParts:
 class TestValidateNumeric:
     """Tests for validate_numeric."""
 
-    @pytest.mark.parametrize(
-        "value, expected",
-        [
-            ("5", Decimal("5")),
-            ("-3.14", Decimal("-3.14")),
-            ("0", Decimal("0")),
-        ],
-    )
+    @pytest.mark.parametrize("value, expected", _VALID_NUMBERS)
     def test_valid_numbers(self, value: str, expected: Decimal) -> None:
         """Valid numeric strings convert to Decimal."""
         assert validate_numeric(value) == expected
 
-    @pytest.mark.parametrize(
-        "value",
-        ["abc", "", "12.34.56"],
-    )
-    def test_invalid_numbers(self, value: str) -> None:
+    def test_invalid_numbers(self, subtests) -> None:
         """Invalid numeric strings return None."""
-        assert validate_numeric(value) is None
+        for value in ("abc", "", "12.34.56", "--", "e"):
+            with subtests.test(value=value):
+                assert validate_numeric(value) is None
+
+    def test_decimal_only_literals_rejected(self, subtests) -> None:
+        """Strings Decimal() would accept but the calculator does not return None."""
+        for value in ("inf", "-Infinity", "nan", "sNaN", "1_000", "\u0661\u0662", "\uff15"):
+            with subtests.test(value=value):
+                Decimal(value)  # accepted by Decimal itself
+                assert validate_numeric(value) is None
+
+    @pytest.mark.parametrize("value", [0, 42, -7])
+    def test_int_input(self, value: int) -> None:
+        """Ints (including a falsy 0) convert directly."""
+        assert validate_numeric(value) == Decimal(value)
+
+    def test_non_numeric_type(self) -> None:
+        """Types other than str, int and Decimal return None."""
+        assert validate_numeric(None) is None
+        assert validate_numeric([1]) is None
+        assert validate_numeric(True) is None
+
+    def test_decimal_passthrough(self) -> None:
+        """A Decimal input is returned as-is."""
+        value = Decimal("2.5")
+        assert validate_numeric(value) is value
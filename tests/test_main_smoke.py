@@ -0,0 +1,25 @@
+"""
+Smoke Tests for the Entry Point
+================================
+
+Checks that ``main.main`` builds a Calculator and starts the REPL.  Marked
+``smoke`` and deselected by default (see ``pytest.ini``); run with
+``pytest -m smoke``.
+"""
+
+import pytest
+
+import main
+
+
+@pytest.mark.smoke
+def test_main_starts_repl(monkeypatch, tmp_path) -> None:
+    """main() constructs a Calculator and calls its run() method."""
+    from app.calculator_repl import Calculator
+
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(Calculator, "run", lambda self: calls.append(self))
+    main.main()
+    assert len(calls) == 1
+    assert isinstance(calls[0], Calculator)
@@ -4,11 +4,13 @@ Tests for the Operations Module
 
 Parameterized tests covering mandatory arithmetic operations:
 add, subtract, multiply, divide, power, root, modulus, int_divide,
-percent, abs_diff — including edge cases.
+percent, abs_diff — including edge cases — plus the float fast path for
+the operations that have one.
 """
 
 import pytest
 from decimal import Decimal
+from fractions import Fraction
 
 from app.exceptions import DivisionByZeroError, InvalidOperationError
 from app.operations import (
@@ -24,26 +26,93 @@ from app.operations import (
     abs_diff,
     get_operation,
     get_supported_operations,
+    is_supported,
     OPERATIONS,
 )
 
 
 # ---------------------------------------------------------------------------
-# add
+# Shared cases: (a, b, expected), built once at import.  Operands are
+# Decimal; expected values are int / Fraction, which compare exactly with
+# Decimal results without constructing more Decimals.
 # ---------------------------------------------------------------------------
 
+# Pooled operands: each value is one shared Decimal object.
+_D: dict[str, Decimal] = {
+    s: Decimal(s)
+    for s in (
+        "-5", "-3", "-2", "-1", "0", "1", "1.5", "2", "2.5", "3",
+        "4", "5", "7", "8", "9", "10", "27", "50", "100", "200",
+    )
+}
+
+_ADD_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["2"], _D["3"], 5),
+    (_D["0"], _D["0"], 0),
+    (_D["-1"], _D["1"], 0),
+    (_D["-5"], _D["-3"], -8),
+    (_D["1.5"], _D["2.5"], 4),
+)
+_SUB_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["5"], _D["3"], 2),
+    (_D["0"], _D["0"], 0),
+    (_D["3"], _D["5"], -2),
+)
+_MUL_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["4"], _D["3"], 12),
+    (_D["0"], _D["100"], 0),
+    (_D["-2"], _D["3"], -6),
+)
+_DIV_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["10"], _D["2"], 5),
+    (_D["7"], _D["2"], Fraction(7, 2)),
+)
+_POW_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["2"], _D["8"], 256),
+    (_D["5"], _D["0"], 1),
+)
+_ROOT_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["9"], _D["2"], 3),
+    (_D["27"], _D["3"], 3),
+)
+_MOD_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["10"], _D["3"], 1),
+    (_D["10"], _D["2"], 0),
+)
+_INT_DIV_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["10"], _D["3"], 3),
+    (_D["10"], _D["2"], 5),
+)
+_PERCENT_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["5"], _D["100"], 5),
+    (_D["50"], _D["200"], 25),
+)
+_ABS_DIFF_CASES: tuple[tuple[Decimal, Decimal, int | Fraction], ...] = (
+    (_D["5"], _D["10"], 5),
+    (_D["10"], _D["5"], 5),
+    (_D["-5"], _D["5"], 10),
+)
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("2"), Decimal("3"), Decimal("5")),
-        (Decimal("0"), Decimal("0"), Decimal("0")),
-        (Decimal("-1"), Decimal("1"), Decimal("0")),
-        (Decimal("-5"), Decimal("-3"), Decimal("-8")),
-        (Decimal("1.5"), Decimal("2.5"), Decimal("4.0")),
-    ],
+# (callable, args, expected exception) for every error path.
+_ERROR_CASES = (
+    pytest.param(divide, (_D["10"], _D["0"]), DivisionByZeroError, id="divide-by-zero"),
+    pytest.param(divide, (_D["0"], _D["0"]), DivisionByZeroError, id="divide-zero-by-zero"),
+    pytest.param(divide, (_D["10"], "2"), TypeError, id="divide-type-error"),
+    pytest.param(nth_root, (_D["9"], _D["0"]), DivisionByZeroError, id="root-by-zero"),
+    pytest.param(modulus, (_D["10"], _D["0"]), DivisionByZeroError, id="modulus-by-zero"),
+    pytest.param(int_divide, (_D["10"], _D["0"]), DivisionByZeroError, id="int-divide-by-zero"),
+    pytest.param(percent, (_D["10"], _D["0"]), DivisionByZeroError, id="percent-by-zero"),
+    pytest.param(get_operation, ("unknown",), InvalidOperationError, id="unknown-operation"),
 )
-def test_add(a: Decimal, b: Decimal, expected: Decimal) -> None:
+
+
+# ---------------------------------------------------------------------------
+# add
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("a, b, expected", _ADD_CASES)
+def test_add(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert add(a, b) == expected
 
 
@@ -52,15 +121,8 @@ def test_add(a: Decimal, b: Decimal, expected: Decimal) -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("5"), Decimal("3"), Decimal("2")),
-        (Decimal("0"), Decimal("0"), Decimal("0")),
-        (Decimal("3"), Decimal("5"), Decimal("-2")),
-    ],
-)
-def test_subtract(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _SUB_CASES)
+def test_subtract(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert subtract(a, b) == expected
 
 
@@ -69,15 +131,8 @@ def test_subtract(a: Decimal, b: Decimal, expected: Decimal) -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("4"), Decimal("3"), Decimal("12")),
-        (Decimal("0"), Decimal("100"), Decimal("0")),
-        (Decimal("-2"), Decimal("3"), Decimal("-6")),
-    ],
-)
-def test_multiply(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _MUL_CASES)
+def test_multiply(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert multiply(a, b) == expected
 
 
@@ -86,35 +141,18 @@ def test_multiply(a: Decimal, b: Decimal, expected: Decimal) -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("10"), Decimal("2"), Decimal("5")),
-        (Decimal("7"), Decimal("2"), Decimal("3.5")),
-    ],
-)
-def test_divide(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _DIV_CASES)
+def test_divide(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert divide(a, b) == expected
 
 
-def test_divide_by_zero() -> None:
-    with pytest.raises(DivisionByZeroError):
-        divide(Decimal("10"), Decimal("0"))
-
-
 # ---------------------------------------------------------------------------
 # nth_power
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("2"), Decimal("8"), Decimal("256")),
-        (Decimal("5"), Decimal("0"), Decimal("1")),
-    ],
-)
-def test_nth_power(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _POW_CASES)
+def test_nth_power(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert nth_power(a, b) == expected
 
 
@@ -123,121 +161,137 @@ def test_nth_power(a: Decimal, b: Decimal, expected: Decimal) -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("9"), Decimal("2"), Decimal("3")),
-        (Decimal("27"), Decimal("3"), Decimal("3")),
-    ],
-)
-def test_nth_root(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _ROOT_CASES)
+def test_nth_root(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert nth_root(a, b) == expected
 
 
-def test_root_by_zero() -> None:
-    with pytest.raises(DivisionByZeroError):
-        nth_root(Decimal("9"), Decimal("0"))
-
-
 # ---------------------------------------------------------------------------
 # modulus
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("10"), Decimal("3"), Decimal("1")),
-        (Decimal("10"), Decimal("2"), Decimal("0")),
-    ],
-)
-def test_modulus(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _MOD_CASES)
+def test_modulus(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert modulus(a, b) == expected
 
 
-def test_modulus_by_zero() -> None:
-    with pytest.raises(DivisionByZeroError):
-        modulus(Decimal("10"), Decimal("0"))
-
-
 # ---------------------------------------------------------------------------
 # int_divide
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("10"), Decimal("3"), Decimal("3")),
-        (Decimal("10"), Decimal("2"), Decimal("5")),
-    ],
-)
-def test_int_divide(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _INT_DIV_CASES)
+def test_int_divide(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert int_divide(a, b) == expected
 
 
-def test_int_divide_by_zero() -> None:
-    with pytest.raises(DivisionByZeroError):
-        int_divide(Decimal("10"), Decimal("0"))
-
-
 # ---------------------------------------------------------------------------
 # percent
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("5"), Decimal("100"), Decimal("5")),
-        (Decimal("50"), Decimal("200"), Decimal("25")),
-    ],
-)
-def test_percent(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _PERCENT_CASES)
+def test_percent(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert percent(a, b) == expected
 
 
-def test_percent_by_zero() -> None:
-    with pytest.raises(DivisionByZeroError):
-        percent(Decimal("10"), Decimal("0"))
-
-
 # ---------------------------------------------------------------------------
 # abs_diff
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Decimal("5"), Decimal("10"), Decimal("5")),
-        (Decimal("10"), Decimal("5"), Decimal("5")),
-        (Decimal("-5"), Decimal("5"), Decimal("10")),
-    ],
-)
-def test_abs_diff(a: Decimal, b: Decimal, expected: Decimal) -> None:
+@pytest.mark.parametrize("a, b, expected", _ABS_DIFF_CASES)
+def test_abs_diff(a: Decimal, b: Decimal, expected: int | Fraction) -> None:
     assert abs_diff(a, b) == expected
 
 
+# ---------------------------------------------------------------------------
+# Error paths
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("fn, args, exc", _ERROR_CASES)
+def test_error_paths(fn, args: tuple, exc: type[Exception]) -> None:
+    with pytest.raises(exc):
+        fn(*args)
+
+
 # ---------------------------------------------------------------------------
 # Strategy registry helpers
 # ---------------------------------------------------------------------------
 
 
+_EXPECTED_OPS: frozenset[str] = frozenset(
+    {"add", "subtract", "multiply", "divide", "power", "root", "modulus", "int_divide", "percent", "abs_diff"}
+)
+
+
 class TestStrategyRegistry:
-    @pytest.mark.parametrize(
-        "name",
-        ["add", "subtract", "multiply", "divide", "power", "root", "modulus", "int_divide", "percent", "abs_diff"],
-    )
-    def test_get_operation_valid(self, name: str) -> None:
-        func = get_operation(name)
-        assert callable(func)
+    def test_get_operation_valid(self) -> None:
+        for name in _EXPECTED_OPS:
+            assert callable(get_operation(name)), name
+
+    def test_get_operation_cached(self) -> None:
+        get_operation.cache_clear()
+        assert get_operation("add") is get_operation("add")
+        assert get_operation.cache_info().hits == 1
 
-    def test_get_operation_invalid(self) -> None:
-        with pytest.raises(InvalidOperationError):
-            get_operation("unknown")
+    def test_get_operation_runtime_name(self) -> None:
+        """Names built at runtime (not interned) still resolve."""
+        assert get_operation("".join(["a", "dd"])) is add
+
+    def test_registry_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            OPERATIONS["sqrt"] = add
+        assert "sqrt" not in OPERATIONS
 
     def test_get_supported_operations(self) -> None:
-        ops = get_supported_operations()
-        expected_ops = {"add", "subtract", "multiply", "divide", "power", "root", "modulus", "int_divide", "percent", "abs_diff"}
-        assert set(ops) == expected_ops
+        assert frozenset(get_supported_operations()) == _EXPECTED_OPS
+
+    def test_get_supported_operations_is_cached(self) -> None:
+        assert get_supported_operations() is get_supported_operations()
+
+    def test_is_supported(self) -> None:
+        assert is_supported("add") is True
+        assert is_supported("unknown") is False
+
+
+# ---------------------------------------------------------------------------
+# Float fast path (app.fast_ops, JIT-compiled when numba is installed)
+# ---------------------------------------------------------------------------
+
+
+# The Decimal cases above, as floats, for every operation with a fast version.
+_FLOAT_CASES: tuple[tuple[str, float, float, float], ...] = tuple(
+    (name, float(a), float(b), float(expected))
+    for name, cases in (
+        ("add", _ADD_CASES),
+        ("subtract", _SUB_CASES),
+        ("multiply", _MUL_CASES),
+        ("divide", _DIV_CASES),
+        ("power", _POW_CASES),
+        ("root", _ROOT_CASES),
+        ("percent", _PERCENT_CASES),
+    )
+    for a, b, expected in cases
+)
+
+
+class TestFloatFastPath:
+    """The float operations (numba or pure Python) agree with the Decimal ones."""
+
+    @pytest.mark.parametrize("name, a, b, expected", _FLOAT_CASES)
+    def test_fast_operation(self, name: str, a: float, b: float, expected: float) -> None:
+        assert get_operation(name, fast=True)(a, b) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("name", ["divide", "root", "percent"])
+    def test_fast_operation_by_zero(self, name: str) -> None:
+        with pytest.raises(DivisionByZeroError):
+            get_operation(name, fast=True)(10.0, 0.0)
+
+    def test_fast_operations_are_jit_compiled(self) -> None:
+        """With numba installed, the fast operations are njit dispatchers."""
+        pytest.importorskip("numba")
+        for name in ("add", "root", "percent"):
+            assert hasattr(get_operation(name, fast=True), "py_func"), name